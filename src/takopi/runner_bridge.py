@@ -290,6 +290,8 @@ class SessionCardEdits:
         self.context_line = context_line
         self.event_seq = 0
         self.rendered_seq = 0
+        # (builder revision, whole elapsed seconds) of the last emitted card.
+        self.last_render_key: tuple[int, int] | None = None
         self.signal_send, self.signal_recv = anyio.create_memory_object_stream(1)
 
         # Set context if provided
@@ -308,6 +310,12 @@ class SessionCardEdits:
 
             seq_at_render = self.event_seq
             now = self.clock()
+            # Cards show whole seconds, so an unchanged builder within the
+            # same second renders identically; skip the rebuild entirely.
+            render_key = (self.builder.revision, int(now - self.started_at))
+            if render_key == self.last_render_key:
+                self.rendered_seq = seq_at_render
+                continue
             state = self.builder.build()
 
             # Use render_session_card if available, fallback to render_progress
@@ -343,6 +351,9 @@ class SessionCardEdits:
                 )
                 if edited is not None:
                     self.last_rendered = rendered
+                    self.last_render_key = render_key
+            else:
+                self.last_render_key = render_key
 
             self.rendered_seq = seq_at_render
 
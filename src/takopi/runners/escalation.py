@@ -9,6 +9,112 @@ from __future__ import annotations
 import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+# Default pattern lists, compiled once at import and shared by every policy.
+_DEFAULT_ESCALATE_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"(?i)delete|remove|destroy|drop|truncate"),
+    re.compile(r"(?i)production|prod|live"),
+    re.compile(r"(?i)api[- ]?key|secret|password|credential|token"),
+    re.compile(r"(?i)billing|payment|cost|charge"),
+    re.compile(r"(?i)force|--force|-f\b"),
+    re.compile(r"(?i)push.*main|push.*master|merge.*main|merge.*master"),
+)
+
+_DEFAULT_AUTO_APPROVE_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"(?i)create.*directory|mkdir"),
+    re.compile(r"(?i)install.*dev.*depend"),
+    re.compile(r"(?i)run.*test|npm test|pytest|cargo test"),
+    re.compile(r"(?i)format.*code|prettier|black|ruff"),
+    re.compile(r"(?i)lint|eslint|flake8"),
+    re.compile(r"(?i)build|compile"),
+    re.compile(r"(?i)read|view|show|list|ls\b|cat\b"),
+)
+
+# assess_urgency() categories, one alternation each, searched against
+# lowercased text (see _fuse_patterns for why that beats IGNORECASE).
+_CRITICAL_URGENCY_RE = re.compile(
+    r"production|prod\s|live\s"
+    r"|billing|payment|charge"
+    r"|api[- ]?key|secret|password|credential"
+)
+_HIGH_URGENCY_RE = re.compile(
+    r"delete|remove|destroy|drop|truncate|force|--force|overwrite|replace.*all"
+)
+_LOW_URGENCY_RE = re.compile(r"create.*directory|mkdir|install.*depend|format|lint")
+
+# Reply shapes recognised by auto_response(), in priority order; searched
+# against lowercased text like the urgency tiers.
+_REPLY_SHAPE_RE = re.compile(
+    r"(?P<yes_no>y/n|yes.*no|\(y\)|\[y\])"
+    r"|(?P<confirm>confirm|proceed|continue|ok\?|okay\?)"
+    r"|(?P<enter>press enter|hit enter|<enter>)"
+)
+
+# Leading inline flag groups such as "(?i)".
+_INLINE_FLAGS_RE = re.compile(r"\A(?:\(\?[aiLmsux]+\))+")
+# Constructs whose meaning depends on group numbering or names, which
+# would change once patterns share one expression.
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+@lru_cache(maxsize=32)
+def _fuse_patterns(patterns: tuple[re.Pattern[str], ...]) -> re.Pattern[str] | None:
+    """Combine case-insensitive patterns into one case-sensitive alternation.
+
+    The result is meant to be searched against lowercased text: without
+    IGNORECASE, SRE can skip ahead on the alternation's leading characters,
+    which makes one fused scan several times cheaper than a loop of
+    case-insensitive searches. Returns None when the patterns cannot be
+    fused that way (other flags, uppercase in the source, backreferences);
+    callers then fall back to searching each pattern in turn.
+    """
+    if not patterns:
+        return None
+    parts: list[str] = []
+    for pattern in patterns:
+        source = pattern.pattern
+        if (
+            not isinstance(source, str)
+            or pattern.flags & ~re.UNICODE != re.IGNORECASE
+            or _GROUP_REFERENCE_RE.search(source)
+        ):
+            return None
+        source = _INLINE_FLAGS_RE.sub("", source)
+        if source != source.lower():
+            return None
+        # "|" binds loosest, so plain joining keeps each pattern intact, and
+        # unlike (?:...) wrappers it leaves SRE's literal-prefix scan enabled.
+        parts.append(source)
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+@dataclass(slots=True)
+class _FusedMatcher:
+    """Single-scan matcher for a pattern list, rebuilt when the list changes."""
+
+    source: tuple[re.Pattern[str], ...] = ()
+    fused: re.Pattern[str] | None = None
+
+    def sync(self, patterns: list[re.Pattern[str]]) -> bool:
+        """Rebuild the fused regex if ``patterns`` changed; report whether it did."""
+        current = tuple(patterns)
+        if current == self.source:
+            return False
+        self.source = current
+        self.fused = _fuse_patterns(current)
+        return True
+
+    def search(self, text: str, lowered: str) -> bool:
+        if self.fused is not None:
+            return self.fused.search(lowered) is not None
+        return any(pattern.search(text) for pattern in self.source)
+
+
+_DECISION_CACHE_SIZE = 512
 
 
 @dataclass(slots=True)
@@ -25,27 +131,12 @@ class EscalationPolicy:
 
     # Always escalate these patterns (destructive, sensitive operations)
     always_escalate_patterns: list[re.Pattern[str]] = field(
-        default_factory=lambda: [
-            re.compile(r"(?i)delete|remove|destroy|drop|truncate"),
-            re.compile(r"(?i)production|prod|live"),
-            re.compile(r"(?i)api[- ]?key|secret|password|credential|token"),
-            re.compile(r"(?i)billing|payment|cost|charge"),
-            re.compile(r"(?i)force|--force|-f\b"),
-            re.compile(r"(?i)push.*main|push.*master|merge.*main|merge.*master"),
-        ]
+        default_factory=lambda: list(_DEFAULT_ESCALATE_PATTERNS)
     )
 
     # Never escalate (auto-answer yes) for these safe operations
     auto_approve_patterns: list[re.Pattern[str]] = field(
-        default_factory=lambda: [
-            re.compile(r"(?i)create.*directory|mkdir"),
-            re.compile(r"(?i)install.*dev.*depend"),
-            re.compile(r"(?i)run.*test|npm test|pytest|cargo test"),
-            re.compile(r"(?i)format.*code|prettier|black|ruff"),
-            re.compile(r"(?i)lint|eslint|flake8"),
-            re.compile(r"(?i)build|compile"),
-            re.compile(r"(?i)read|view|show|list|ls\b|cat\b"),
-        ]
+        default_factory=lambda: list(_DEFAULT_AUTO_APPROVE_PATTERNS)
     )
 
     # Timeout before auto-handling (None = always wait for user)
@@ -54,6 +145,17 @@ class EscalationPolicy:
     # Custom decision function: (question, context) -> "escalate" | "auto" | None
     custom_decider: Callable[[str, str], str | None] | None = None
 
+    _escalate_matcher: _FusedMatcher = field(
+        default_factory=_FusedMatcher, init=False, repr=False, compare=False
+    )
+    _approve_matcher: _FusedMatcher = field(
+        default_factory=_FusedMatcher, init=False, repr=False, compare=False
+    )
+    # Pattern-only decisions, oldest first; cleared when either list changes.
+    _decisions: dict[tuple[str, str | None], bool] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def should_escalate(self, question: str, context: str | None = None) -> bool:
         """Determine if a question should be escalated to the user.
 
@@ -65,17 +167,36 @@ class EscalationPolicy:
             True if the question should be escalated to the user,
             False if the liaison should handle it automatically
         """
+        changed = self._escalate_matcher.sync(self.always_escalate_patterns)
+        if self._approve_matcher.sync(self.auto_approve_patterns) or changed:
+            self._decisions.clear()
+
+        # A custom decider may be stateful, so only pattern decisions are cached.
+        if self.custom_decider is not None:
+            return self._decide(question, context)
+
+        key = (question, context)
+        cached = self._decisions.get(key)
+        if cached is not None:
+            return cached
+        decision = self._decide(question, context)
+        if len(self._decisions) >= _DECISION_CACHE_SIZE:
+            del self._decisions[next(iter(self._decisions))]
+        self._decisions[key] = decision
+        return decision
+
+    def _decide(self, question: str, context: str | None) -> bool:
         full_text = f"{question} {context or ''}"
 
+        lowered = full_text.lower()
+
         # Check always-escalate patterns first (safety critical)
-        for pattern in self.always_escalate_patterns:
-            if pattern.search(full_text):
-                return True
+        if self._escalate_matcher.search(full_text, lowered):
+            return True
 
         # Check auto-approve patterns (known safe operations)
-        for pattern in self.auto_approve_patterns:
-            if pattern.search(full_text):
-                return False
+        if self._approve_matcher.search(full_text, lowered):
+            return False
 
         # Use custom decider if available
         if self.custom_decider is not None:
@@ -101,18 +222,22 @@ class EscalationPolicy:
         if self.should_escalate(question, context):
             return None
 
-        full_text = f"{question} {context or ''}"
-
-        # Check if it's a yes/no question
-        if re.search(r"(?i)y/n|yes.*no|\(y\)|\[y\]", question):
-            return "y"
-
-        # Check if it's asking for confirmation
-        if re.search(r"(?i)confirm|proceed|continue|ok\?|okay\?", question):
+        # One scan classifies the question's shape. A yes/no prompt wins over
+        # a confirmation or an Enter prompt wherever it appears, and the
+        # alternatives cannot overlap, so stopping at the first yes/no hit
+        # matches checking each shape separately.
+        shapes: set[str | None] = set()
+        for match in _REPLY_SHAPE_RE.finditer(question.lower()):
+            if match.lastgroup == "yes_no":
+                return "y"
+            shapes.add(match.lastgroup)
+
+        # Asking for confirmation
+        if "confirm" in shapes:
             return "yes"
 
-        # Check if it's asking to press enter
-        if re.search(r"(?i)press enter|hit enter|<enter>", question):
+        # Asking to press enter
+        if "enter" in shapes:
             return ""  # Empty string triggers Enter key
 
         # Default affirmative
@@ -128,36 +253,18 @@ class EscalationPolicy:
         Returns:
             Urgency level: "low", "normal", "high", or "critical"
         """
-        full_text = f"{question} {context or ''}"
+        lowered = f"{question} {context or ''}".lower()
 
         # Critical: production, billing, credentials
-        critical_patterns = [
-            r"(?i)production|prod\s|live\s",
-            r"(?i)billing|payment|charge",
-            r"(?i)api[- ]?key|secret|password|credential",
-        ]
-        for pattern in critical_patterns:
-            if re.search(pattern, full_text):
-                return "critical"
+        if _CRITICAL_URGENCY_RE.search(lowered):
+            return "critical"
 
         # High: destructive operations
-        high_patterns = [
-            r"(?i)delete|remove|destroy|drop|truncate",
-            r"(?i)force|--force",
-            r"(?i)overwrite|replace.*all",
-        ]
-        for pattern in high_patterns:
-            if re.search(pattern, full_text):
-                return "high"
+        if _HIGH_URGENCY_RE.search(lowered):
+            return "high"
 
         # Low: routine confirmations
-        low_patterns = [
-            r"(?i)create.*directory|mkdir",
-            r"(?i)install.*depend",
-            r"(?i)format|lint",
-        ]
-        for pattern in low_patterns:
-            if re.search(pattern, full_text):
-                return "low"
+        if _LOW_URGENCY_RE.search(lowered):
+            return "low"
 
         return "normal"
@@ -30,6 +30,7 @@ from ..model import (
 )
 from ..runner import BaseRunner, ResumeTokenMixin, Runner
 from .escalation import EscalationPolicy
+from .liaison_coordination import ensure_dir, recreate_dir
 
 ENGINE: EngineId = "liaison"
 
@@ -39,14 +40,37 @@ _RESUME_RE = re.compile(
     r"(?im)^\s*`?liaison\s+--session\s+(?P<token>[^`\s]+)`?\s*$"
 )
 
-# Patterns for detecting questions in subagent output
-_QUESTION_PATTERNS = [
-    re.compile(r"(?:Do you want|Would you like|Should I|Can I|May I)\s+.+\?", re.I),
-    re.compile(r"\?\s*$"),
-    re.compile(r"(?:y/n|yes/no|Y/N)\s*[:>]?\s*$"),
-    re.compile(r"(?:confirm|proceed|continue)\s*\?", re.I),
-    re.compile(r"Press Enter to continue", re.I),
-]
+# Lowercased phrases that mark a subagent's task as finished
+_COMPLETION_MARKERS = ("task completed", "done.", "finished.", "all tasks complete")
+
+# Arguments made only of these characters need no shell quoting
+_SHELL_SAFE_RE = re.compile(r"[a-zA-Z0-9_\-./=]+")
+
+# Pattern for detecting questions in subagent output
+_QUESTION_RE = re.compile(
+    r"(?i:(?:Do you want|Would you like|Should I|Can I|May I)\s+.+\?)"
+    r"|\?\s*$"
+    r"|(?:y/n|yes/no|Y/N)\s*[:>]?\s*$"
+    r"|(?i:(?:confirm|proceed|continue)\s*\?)"
+    r"|(?i:Press Enter to continue)"
+)
+# The only alternatives of _QUESTION_RE that can match without a "?".
+_YES_NO_PROMPT_RE = re.compile(r"(?:y/n|yes/no|Y/N)\s*[:>]?\s*$")
+
+
+def _is_question(line: str) -> bool:
+    """Return True if ``line`` matches _QUESTION_RE.
+
+    Most pane lines contain no "?", and for those only the y/n and
+    press-enter prompts can match; checking them directly is much cheaper
+    than running the full alternation, which defeats the literal prefix scan.
+    """
+    if "?" in line:
+        return _QUESTION_RE.search(line) is not None
+    return (
+        _YES_NO_PROMPT_RE.search(line) is not None
+        or "press enter to continue" in line.lower()
+    )
 
 
 @dataclass(slots=True)
@@ -209,11 +233,11 @@ class LiaisonRunner(ResumeTokenMixin, BaseRunner):
         folder = state.coordination_folder
         if folder is None:
             return
-        (folder / "sessions").mkdir(parents=True, exist_ok=True)
-        (folder / "coordination" / "inbox").mkdir(parents=True, exist_ok=True)
-        (folder / "coordination" / "broadcast").mkdir(parents=True, exist_ok=True)
-        (folder / "state").mkdir(parents=True, exist_ok=True)
-        (folder / "locks").mkdir(parents=True, exist_ok=True)
+        ensure_dir(folder / "sessions")
+        ensure_dir(folder / "coordination" / "inbox")
+        ensure_dir(folder / "coordination" / "broadcast")
+        ensure_dir(folder / "state")
+        ensure_dir(folder / "locks")
 
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
@@ -427,7 +451,7 @@ When a subagent completes a task, briefly report the result to the user, then st
         """Escape a string for shell use."""
         if not s:
             return "''"
-        if re.match(r"^[a-zA-Z0-9_\-./=]+$", s):
+        if _SHELL_SAFE_RE.fullmatch(s):
             return s
         return "'" + s.replace("'", "'\"'\"'") + "'"
 
@@ -624,32 +648,28 @@ When a subagent completes a task, briefly report the result to the user, then st
                 continue
 
             # Check for question patterns
-            for pattern in _QUESTION_PATTERNS:
-                if pattern.search(line):
-                    # Check escalation policy
-                    if self.escalation_policy.should_escalate(line):
-                        event = self._create_input_request(line, pane, state)
-                        if event:
-                            events.append(event)
-                    else:
-                        # Auto-respond
-                        auto_response = self.escalation_policy.auto_response(line)
-                        if auto_response is not None:
-                            # Queue auto-response (will be sent in next iteration)
-                            asyncio.create_task(
-                                self._send_to_pane(pane, auto_response)
-                            )
-                            state.note_seq += 1
-                            events.append(
-                                state.factory.action_completed(
-                                    action_id=f"liaison.auto.{state.note_seq}",
-                                    kind="note",
-                                    title=f"Auto-responded: {auto_response}",
-                                    ok=True,
-                                    detail={"question": line},
-                                )
-                            )
-                    break
+            if _is_question(line):
+                # Check escalation policy; auto_response() is None exactly
+                # when the policy escalates, so one call both classifies
+                # the question and picks the answer.
+                auto_response = self.escalation_policy.auto_response(line)
+                if auto_response is None:
+                    event = self._create_input_request(line, pane, state)
+                    if event:
+                        events.append(event)
+                else:
+                    # Queue auto-response (will be sent in next iteration)
+                    asyncio.create_task(self._send_to_pane(pane, auto_response))
+                    state.note_seq += 1
+                    events.append(
+                        state.factory.action_completed(
+                            action_id=f"liaison.auto.{state.note_seq}",
+                            kind="note",
+                            title=f"Auto-responded: {auto_response}",
+                            ok=True,
+                            detail={"question": line},
+                        )
+                    )
 
             # Check for completion markers
             if self._is_completion_marker(line):
@@ -660,12 +680,16 @@ When a subagent completes a task, briefly report the result to the user, then st
 
     def _truncate_output(self, output: str, max_lines: int = 5) -> str:
         """Truncate output to show in progress updates."""
-        lines = output.strip().splitlines()
-        # Take the last N non-empty lines (most recent activity)
-        non_empty = [line for line in lines if line.strip()]
-        if len(non_empty) <= max_lines:
-            return "\n".join(non_empty)
-        return "\n".join(non_empty[-max_lines:])
+        # Take the last N non-empty lines (most recent activity), walking
+        # back from the end so earlier lines are never inspected.
+        tail: list[str] = []
+        for line in reversed(output.strip().splitlines()):
+            if line.strip():
+                tail.append(line)
+                if len(tail) == max_lines:
+                    break
+        tail.reverse()
+        return "\n".join(tail)
 
     def _create_input_request(
         self, question: str, pane: TmuxPane, state: LiaisonStreamState
@@ -695,13 +719,8 @@ When a subagent completes a task, briefly report the result to the user, then st
 
     def _is_completion_marker(self, line: str) -> bool:
         """Check if a line indicates task completion."""
-        markers = [
-            "Task completed",
-            "Done.",
-            "Finished.",
-            "All tasks complete",
-        ]
-        return any(marker.lower() in line.lower() for marker in markers)
+        lowered = line.lower()
+        return any(marker in lowered for marker in _COMPLETION_MARKERS)
 
     def _check_completion(self, state: LiaisonStreamState) -> bool:
         """Check if the liaison task is complete."""
@@ -738,7 +757,13 @@ When a subagent completes a task, briefly report the result to the user, then st
             "coordination_folder": str(state.coordination_folder),
         }
 
-        session_file.write_text(json.dumps(data, indent=2))
+        payload = json.dumps(data, indent=2)
+        try:
+            session_file.write_text(payload)
+        except FileNotFoundError:
+            # The folder was removed behind our back.
+            recreate_dir(session_file.parent)
+            session_file.write_text(payload)
 
     async def _restore_session(
         self, session_id: str, state: LiaisonStreamState
@@ -6,46 +6,171 @@ them to collaborate on tasks and avoid duplicating work.
 
 from __future__ import annotations
 
+import ctypes
 import fcntl
-import json
+import io
+import itertools
+import mmap
 import os
 import secrets
+import select
+import struct
+import sys
 import time
-from contextlib import contextmanager
+from collections import OrderedDict
+from collections.abc import Container, Iterable, Iterator
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any
 
+import msgspec
 
-@dataclass(frozen=True, slots=True)
-class CoordinationMessage:
+from ..utils.json_state import atomic_write_json
+
+# Bounds for the flock try-lock loop in LiaisonCoordinator._file_lock.
+_LOCK_TIMEOUT_S = 10.0
+_LOCK_INITIAL_DELAY_S = 0.0005
+_LOCK_MAX_DELAY_S = 0.05
+
+# Lock-guarded files under state/, in the order batch() locks them. A fixed
+# order means two batches can never each hold a lock the other is waiting on.
+_STATE_FILES = ("active_liaisons.json", "shared_context.json", "task_registry.json")
+
+# Message ids are correlation tags, not secrets: a per-process prefix plus a
+# counter is unique across liaisons without an RNG draw per message. The
+# random salt guards against pid reuse while older broadcasts are still live.
+_MESSAGE_ID_PREFIX = f"{os.getpid():x}{secrets.token_hex(2)}"
+_message_counter = itertools.count()
+
+
+def _reset_message_ids() -> None:
+    # A forked child inherits the prefix and counter; without a fresh pair it
+    # would mint the parent's ids and peers would drop them as already seen.
+    global _MESSAGE_ID_PREFIX, _message_counter
+    _MESSAGE_ID_PREFIX = f"{os.getpid():x}{secrets.token_hex(2)}"
+    _message_counter = itertools.count()
+
+
+os.register_at_fork(after_in_child=_reset_message_ids)
+
+
+def _next_message_id(kind: str) -> str:
+    return f"{kind}_{_MESSAGE_ID_PREFIX}_{next(_message_counter):x}"
+
+
+# Directories this process has already created; mkdir(parents=True) costs a
+# stat/mkdirat per path component, so steady-state sends skip it entirely.
+_ENSURED_DIRS: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory once per process, skipping the mkdir afterwards."""
+    if path in _ENSURED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def recreate_dir(path: Path) -> None:
+    """Recreate a directory that was removed after this process created it."""
+    _ENSURED_DIRS.discard(path)
+    ensure_dir(path)
+
+
+# Upper bound on broadcast ids remembered per coordinator.
+_MAX_TRACKED_BROADCASTS = 10_000
+
+
+class _RecentIds:
+    """Bounded set of message ids with least-recently-seen eviction.
+
+    Membership checks refresh an id, so broadcasts whose files are still
+    being scanned stay tracked while ids of long-gone files age out.
+    """
+
+    __slots__ = ("_ids", "_maxsize")
+
+    def __init__(self, maxsize: int = _MAX_TRACKED_BROADCASTS) -> None:
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        self._maxsize = maxsize
+
+    def __contains__(self, message_id: object) -> bool:
+        if message_id not in self._ids:
+            return False
+        self._ids.move_to_end(message_id)  # type: ignore[arg-type]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, message_id: str) -> None:
+        self._ids[message_id] = None
+        self._ids.move_to_end(message_id)
+        if len(self._ids) > self._maxsize:
+            self._ids.popitem(last=False)
+
+
+# inotify(7) constants for LiaisonCoordinator.wait_for_messages.
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_IGNORED = 0x00008000
+_INOTIFY_EVENT = struct.Struct("iIII")
+_INOTIFY_READ_SIZE = 64 * 1024
+
+
+@cache
+def _inotify_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _json_entries(folder: Path) -> list[os.DirEntry[str]]:
+    """List the message files in ``folder`` with one getdents pass."""
+    try:
+        with os.scandir(folder) as entries:
+            return [entry for entry in entries if entry.name.endswith(".json")]
+    except FileNotFoundError:
+        return []
+
+
+def _fsync_dir(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class CoordinationMessage(msgspec.Struct, frozen=True, kw_only=True, gc=False):
     """A message between liaison agents."""
 
     message_id: str
     from_liaison: str
-    to_liaison: str | None  # None = broadcast to all
+    to_liaison: str | None = None  # None = broadcast to all
     timestamp: float
     type: str  # "info_share", "question", "task_claim", "task_complete"
-    payload: dict[str, Any]
+    payload: dict[str, Any] = {}
     expires_at: float | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "message_id": self.message_id,
-            "from_liaison": self.from_liaison,
-            "to_liaison": self.to_liaison,
-            "timestamp": self.timestamp,
-            "type": self.type,
-            "payload": self.payload,
-            "expires_at": self.expires_at,
-        }
+        return msgspec.to_builtins(self)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> CoordinationMessage:
+        to_liaison = data.get("to_liaison")
         return cls(
             message_id=data["message_id"],
-            from_liaison=data["from_liaison"],
-            to_liaison=data.get("to_liaison"),
+            from_liaison=sys.intern(data["from_liaison"]),
+            to_liaison=sys.intern(to_liaison) if to_liaison is not None else None,
             timestamp=data["timestamp"],
             type=data["type"],
             payload=data.get("payload", {}),
@@ -53,33 +178,144 @@ class CoordinationMessage:
         )
 
 
+class _MessageEnvelope(msgspec.Struct, kw_only=True, gc=False):
+    """Wire view of a CoordinationMessage with the payload left undecoded.
+
+    Readers filter on the envelope (expiry, sender, already-seen broadcasts)
+    and only parse the payload for messages they actually return.
+    """
+
+    message_id: str
+    from_liaison: str
+    to_liaison: str | None = None
+    timestamp: float
+    type: str
+    payload: msgspec.Raw = msgspec.Raw(b"{}")
+    expires_at: float | None = None
+
+
+_MESSAGE_ENCODER = msgspec.json.Encoder()
+_ENVELOPE_DECODER = msgspec.json.Decoder(_MessageEnvelope)
+_PAYLOAD_DECODER = msgspec.json.Decoder(dict[str, Any])
+
+
 @dataclass(slots=True)
 class LiaisonCoordinator:
     """Handles inter-liaison communication via shared folder."""
 
     folder: Path
     liaison_id: str
-    _read_broadcast_ids: set[str] = field(default_factory=set)
+    _read_broadcast_ids: _RecentIds = field(default_factory=_RecentIds)
+    # Broadcast files already delivered, keyed by name, mtime and size, so
+    # later polls skip them without opening or decoding them again.
+    _read_broadcast_files: _RecentIds = field(default_factory=_RecentIds)
+    # Active batch() state: deferred state writes and the locks held for them.
+    _batch_writes: dict[Path, Any] | None = None
+    _batch_locks: set[Path] | None = None
+    _batch_stack: ExitStack | None = None
+    # Last decoded state per file for read-only callers, keyed on the file's
+    # (inode, mtime_ns, size); atomic renames give every write a new key.
+    _state_cache: dict[Path, tuple[tuple[int, int, int], Any]] = field(
+        default_factory=dict
+    )
+    # inotify watch on our inbox and the broadcast folder, armed lazily by
+    # wait_for_messages(); _watch_dirty means a scan is due.
+    _watch: io.FileIO | None = None
+    _watch_dirty: bool = True
 
     def __post_init__(self) -> None:
+        self.liaison_id = sys.intern(self.liaison_id)
         self._ensure_folders()
 
     def _ensure_folders(self) -> None:
         """Create the coordination folder structure."""
-        (self.folder / "coordination" / "inbox").mkdir(parents=True, exist_ok=True)
-        (self.folder / "coordination" / "broadcast").mkdir(parents=True, exist_ok=True)
-        (self.folder / "inbox" / self.liaison_id).mkdir(parents=True, exist_ok=True)
-        (self.folder / "state").mkdir(parents=True, exist_ok=True)
-        (self.folder / "locks").mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.folder / "coordination" / "inbox")
+        ensure_dir(self.folder / "coordination" / "broadcast")
+        ensure_dir(self.folder / "inbox" / self.liaison_id)
+        ensure_dir(self.folder / "state")
+        ensure_dir(self.folder / "locks")
 
     @contextmanager
-    def _file_lock(self, path: Path) -> Iterator[None]:
-        """Acquire an exclusive lock on a file."""
-        lock_path = self.folder / "locks" / f"{path.stem}.lock"
-        lock_path.parent.mkdir(parents=True, exist_ok=True)
+    def batch(self) -> Iterator[None]:
+        """Coalesce state mutations into one lock hold and one flush.
+
+        Entering the block locks every state file in ``_STATE_FILES`` order
+        and holds them until exit, so batches touching files in different
+        orders cannot deadlock. Writes are buffered in memory (later reads see
+        them) and flushed atomically with a single directory fsync when the
+        block exits normally. Nested calls join the outer batch.
+        """
+        if self._batch_writes is not None:
+            yield
+            return
+        with ExitStack() as stack:
+            locks: set[Path] = set()
+            for name in _STATE_FILES:
+                path = self.folder / "state" / name
+                stack.enter_context(self._acquire_lock(path, timeout=_LOCK_TIMEOUT_S))
+                locks.add(path)
+            self._batch_writes = {}
+            self._batch_locks = locks
+            self._batch_stack = stack
+            try:
+                yield
+                writes = self._batch_writes
+                for path, data in writes.items():
+                    atomic_write_json(path, data, sort_keys=False)
+                if writes:
+                    _fsync_dir(self.folder / "state")
+            finally:
+                self._batch_writes = None
+                self._batch_locks = None
+                self._batch_stack = None
 
-        with open(lock_path, "w") as lock_file:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    @contextmanager
+    def _file_lock(
+        self, path: Path, *, timeout: float = _LOCK_TIMEOUT_S
+    ) -> Iterator[None]:
+        """Hold the lock for ``path``, deferring release to an active batch."""
+        if self._batch_stack is None or self._batch_locks is None:
+            with self._acquire_lock(path, timeout=timeout):
+                yield
+            return
+        if path not in self._batch_locks:
+            # Only files outside _STATE_FILES get here; batch() already holds
+            # the rest.
+            self._batch_stack.enter_context(self._acquire_lock(path, timeout=timeout))
+            self._batch_locks.add(path)
+        yield
+
+    @contextmanager
+    def _acquire_lock(self, path: Path, *, timeout: float) -> Iterator[None]:
+        """Acquire an exclusive lock on a file.
+
+        Uses a non-blocking try-lock with exponential backoff so a wedged
+        peer cannot hang this liaison forever; raises TimeoutError once
+        ``timeout`` seconds pass without acquiring the lock.
+        """
+        lock_path = self.folder / "locks" / f"{path.stem}.lock"
+        ensure_dir(lock_path.parent)
+        try:
+            lock_file = open(lock_path, "w")  # noqa: SIM115
+        except FileNotFoundError:
+            # The locks dir was removed behind our back.
+            recreate_dir(lock_path.parent)
+            lock_file = open(lock_path, "w")  # noqa: SIM115
+
+        with lock_file:
+            delay = _LOCK_INITIAL_DELAY_S
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(
+                            f"timed out after {timeout}s waiting for {lock_path}"
+                        ) from None
+                    time.sleep(delay)
+                    delay = min(delay * 2, _LOCK_MAX_DELAY_S)
             try:
                 yield
             finally:
@@ -87,77 +323,247 @@ class LiaisonCoordinator:
 
     def _load_json(self, path: Path, default: Any = None) -> Any:
         """Load JSON from a file, returning default if not found."""
-        if not path.exists():
-            return default if default is not None else {}
+        if self._batch_writes is not None and path in self._batch_writes:
+            return self._batch_writes[path]
         try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
+            return msgspec.json.decode(path.read_bytes())
+        except (msgspec.DecodeError, OSError):
             return default if default is not None else {}
 
+    def _load_json_snapshot(self, path: Path, default: Any) -> Any:
+        """Load JSON for read-only use, reusing the last decode if unchanged."""
+        if self._batch_writes is not None and path in self._batch_writes:
+            return self._batch_writes[path]
+        try:
+            with open(path, "rb") as handle:
+                st = os.fstat(handle.fileno())
+                key = (st.st_ino, st.st_mtime_ns, st.st_size)
+                cached = self._state_cache.get(path)
+                if cached is not None and cached[0] == key:
+                    return cached[1]
+                data = msgspec.json.decode(handle.read())
+        except (msgspec.DecodeError, OSError):
+            self._state_cache.pop(path, None)
+            return default
+        self._state_cache[path] = (key, data)
+        return data
+
     def _save_json(self, path: Path, data: Any) -> None:
-        """Save data as JSON to a file."""
-        path.write_text(json.dumps(data, indent=2))
+        """Save data as JSON to a file via write-to-temp and atomic rename."""
+        if self._batch_writes is not None:
+            self._batch_writes[path] = data
+            return
+        atomic_write_json(path, data, sort_keys=False)
 
     def send_message(self, message: CoordinationMessage) -> None:
         """Send a message to another liaison or broadcast to all."""
         if message.to_liaison is None:
             # Broadcast
             dest = self.folder / "coordination" / "broadcast"
-            filename = f"{int(message.timestamp * 1000)}_{self.liaison_id}.json"
         else:
             # Direct message
             dest = self.folder / "coordination" / "inbox" / message.to_liaison
-            dest.mkdir(parents=True, exist_ok=True)
-            filename = f"{int(message.timestamp * 1000)}_{self.liaison_id}.json"
+            ensure_dir(dest)
+        # The sequence suffix keeps messages sent within the same millisecond
+        # from overwriting each other.
+        filename = (
+            f"{int(message.timestamp * 1000)}_{self.liaison_id}"
+            f"_{next(_message_counter):x}.json"
+        )
 
         filepath = dest / filename
-        self._save_json(filepath, message.to_dict())
+        data = _MESSAGE_ENCODER.encode(message)
+        try:
+            filepath.write_bytes(data)
+        except FileNotFoundError:
+            # The directory was removed behind our back.
+            recreate_dir(dest)
+            filepath.write_bytes(data)
+
+    def send_messages(self, messages: Iterable[CoordinationMessage]) -> None:
+        """Send several messages; each lands in its own file."""
+        for message in messages:
+            self.send_message(message)
 
     def receive_messages(self) -> list[CoordinationMessage]:
         """Check inbox and broadcast for new messages."""
-        messages: list[CoordinationMessage] = []
+        return list(self.receive_messages_iter())
+
+    def receive_messages_iter(self) -> Iterator[CoordinationMessage]:
+        """Yield new inbox and broadcast messages one at a time.
+
+        Each message is consumed (inbox file removed, broadcast marked read)
+        before it is yielded, so stopping early never redelivers it; the
+        messages not reached yet stay queued for the next call.
+        """
+        if self._watch is not None:
+            if not self._watch_dirty and not self._drain_watch(0):
+                return
+            # Events arriving during the scan stay queued for the next call.
+            self._watch_dirty = False
         now = time.time()
-
-        # Check direct inbox
-        inbox = self.folder / "coordination" / "inbox" / self.liaison_id
-        if inbox.exists():
-            for filepath in inbox.glob("*.json"):
-                msg = self._read_message(filepath, now)
+        finished = False
+        try:
+            # Check direct inbox
+            inbox = self.folder / "coordination" / "inbox" / self.liaison_id
+            for entry in _json_entries(inbox):
+                msg = self._read_message(Path(entry.path), now)
+                if msg is not None:
+                    os.unlink(entry.path)  # Remove after reading
+                    yield msg
+
+            # Check broadcast (don't delete, just track read IDs)
+            broadcast = self.folder / "coordination" / "broadcast"
+            for entry in _json_entries(broadcast):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                file_key = f"{entry.name}:{st.st_mtime_ns}:{st.st_size}"
+                if file_key in self._read_broadcast_files:
+                    continue
+                msg = self._read_message(
+                    Path(entry.path), now, skip_ids=self._read_broadcast_ids
+                )
                 if msg is not None:
-                    messages.append(msg)
-                    filepath.unlink()  # Remove after reading
-
-        # Check broadcast (don't delete, just track read IDs)
-        broadcast = self.folder / "coordination" / "broadcast"
-        if broadcast.exists():
-            for filepath in broadcast.glob("*.json"):
-                msg = self._read_message(filepath, now)
-                if msg is not None and msg.message_id not in self._read_broadcast_ids:
-                    messages.append(msg)
                     self._read_broadcast_ids.add(msg.message_id)
-
-        return messages
+                    self._read_broadcast_files.add(file_key)
+                    yield msg
+            finished = True
+        finally:
+            if not finished:
+                # Unscanned files may be waiting; rescan on the next call.
+                self._watch_dirty = True
+
+    def wait_for_messages(self, timeout: float) -> bool:
+        """Block until new messages may be available or ``timeout`` elapses.
+
+        Returns True when receive_messages() has something to scan. On Linux
+        this waits on an inotify watch, so idle liaisons make no syscalls;
+        elsewhere it sleeps for ``timeout`` and always returns True.
+        """
+        if self._watch is None and not self._start_watch():
+            time.sleep(timeout)
+            return True
+        if not self._watch_dirty:
+            self._watch_dirty = self._drain_watch(timeout)
+        return self._watch_dirty
+
+    def close(self) -> None:
+        """Release the inotify watch, if one is armed."""
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+        self._watch_dirty = True
+
+    def _start_watch(self) -> bool:
+        libc = _inotify_libc()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return False
+        watch = io.FileIO(fd, "rb", closefd=True)
+        inbox = self.folder / "coordination" / "inbox" / self.liaison_id
+        ensure_dir(inbox)
+        broadcast = self.folder / "coordination" / "broadcast"
+        for path in (inbox, broadcast):
+            wd = libc.inotify_add_watch(
+                fd, os.fsencode(path), _IN_CLOSE_WRITE | _IN_MOVED_TO
+            )
+            if wd < 0:
+                watch.close()
+                return False
+        self._watch = watch
+        # Messages may have arrived before the watch existed.
+        self._watch_dirty = True
+        return True
+
+    def _drain_watch(self, timeout: float) -> bool:
+        """Consume pending inotify events; return True if there were any."""
+        assert self._watch is not None
+        poller = select.poll()
+        poller.register(self._watch, select.POLLIN)
+        if not poller.poll(max(timeout, 0) * 1000):
+            return False
+        data = self._watch.read(_INOTIFY_READ_SIZE) or b""
+        offset = 0
+        while offset + _INOTIFY_EVENT.size <= len(data):
+            _wd, mask, _cookie, name_len = _INOTIFY_EVENT.unpack_from(data, offset)
+            if mask & _IN_IGNORED:
+                # A watched folder was removed; fall back to scanning until
+                # wait_for_messages() re-arms the watch.
+                self.close()
+                break
+            offset += _INOTIFY_EVENT.size + name_len
+        return True
 
     def _read_message(
-        self, filepath: Path, now: float
+        self,
+        filepath: Path,
+        now: float,
+        *,
+        skip_ids: Container[str] = (),
     ) -> CoordinationMessage | None:
-        """Read and validate a message file."""
+        """Read and validate a message file.
+
+        The file is memory-mapped and decoded in place, so readers of a
+        shared broadcast are served from the page cache without copying it.
+        """
         try:
-            data = json.loads(filepath.read_text())
-            msg = CoordinationMessage.from_dict(data)
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                return None
+            with mmap.mmap(fd, size, prot=mmap.PROT_READ) as mapped:
+                return self._decode_message(mapped, now, skip_ids)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
+    def _decode_message(
+        self,
+        data: mmap.mmap,
+        now: float,
+        skip_ids: Container[str],
+    ) -> CoordinationMessage | None:
+        """Decode a message, rejecting expired, own, or skipped messages.
+
+        Nothing referencing ``data`` may outlive this call, since the caller
+        closes the mapping as soon as it returns.
+        """
+        try:
+            envelope = _ENVELOPE_DECODER.decode(data)
 
             # Check expiration
-            if msg.expires_at is not None and msg.expires_at < now:
+            if envelope.expires_at is not None and envelope.expires_at < now:
                 return None
 
             # Don't return our own messages
-            if msg.from_liaison == self.liaison_id:
+            if envelope.from_liaison == self.liaison_id:
+                return None
+
+            if envelope.message_id in skip_ids:
                 return None
 
-            return msg
-        except (json.JSONDecodeError, KeyError, OSError):
+            payload = _PAYLOAD_DECODER.decode(envelope.payload)
+        except msgspec.DecodeError:
             return None
 
+        return CoordinationMessage(
+            message_id=envelope.message_id,
+            from_liaison=envelope.from_liaison,
+            to_liaison=envelope.to_liaison,
+            timestamp=envelope.timestamp,
+            type=envelope.type,
+            payload=payload,
+            expires_at=envelope.expires_at,
+        )
+
     def register_liaison(self, task: str) -> None:
         """Register this liaison as active."""
         active_file = self.folder / "state" / "active_liaisons.json"
@@ -196,7 +602,7 @@ class LiaisonCoordinator:
     def get_active_liaisons(self) -> dict[str, dict[str, Any]]:
         """Get information about all active liaisons."""
         active_file = self.folder / "state" / "active_liaisons.json"
-        data = self._load_json(active_file, {"liaisons": {}, "version": 1})
+        data = self._load_json_snapshot(active_file, {"liaisons": {}, "version": 1})
 
         # Filter out stale liaisons (no heartbeat in 60 seconds)
         now = time.time()
@@ -204,7 +610,7 @@ class LiaisonCoordinator:
         for lid, info in data.get("liaisons", {}).items():
             last_heartbeat = info.get("last_heartbeat", 0)
             if now - last_heartbeat < 60:
-                active[lid] = info
+                active[lid] = dict(info)
 
         return active
 
@@ -270,7 +676,7 @@ class LiaisonCoordinator:
     def broadcast_discovery(self, topic: str, data: dict[str, Any]) -> None:
         """Broadcast a discovery to all liaisons."""
         msg = CoordinationMessage(
-            message_id=f"discovery_{secrets.token_hex(8)}",
+            message_id=_next_message_id("discovery"),
             from_liaison=self.liaison_id,
             to_liaison=None,  # Broadcast
             timestamp=time.time(),
@@ -284,7 +690,7 @@ class LiaisonCoordinator:
         self, to_liaison: str, question: str, context: dict[str, Any] | None = None
     ) -> str:
         """Send a question to a specific liaison."""
-        msg_id = f"question_{secrets.token_hex(8)}"
+        msg_id = _next_message_id("question")
         msg = CoordinationMessage(
             message_id=msg_id,
             from_liaison=self.liaison_id,
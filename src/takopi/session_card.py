@@ -6,8 +6,12 @@ there's 1 agent or N agents working on a task.
 
 from __future__ import annotations
 
+import sys
 import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
@@ -57,6 +61,17 @@ class PendingInput:
     options: tuple[str, ...] | None = None
     context: str | None = None
     received_at: float = field(default_factory=time.time)
+    # Card preview of the question, computed once instead of on every render.
+    short_question: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        question = self.question
+        short = question[:80] + "..." if len(question) > 80 else question
+        object.__setattr__(self, "short_question", short)
+
+
+# Session statuses after which no further updates arrive.
+_TERMINAL_STATUSES = frozenset({"done", "cancelled", "error"})
 
 
 @dataclass(frozen=True, slots=True)
@@ -100,12 +115,12 @@ class SessionCardState:
     @property
     def has_pending_inputs(self) -> bool:
         """True if there are questions waiting for response."""
-        return len(self.pending_inputs) > 0
+        return bool(self.pending_inputs)
 
     @property
     def is_complete(self) -> bool:
         """True if the session has finished."""
-        return self.status in ("done", "cancelled", "error")
+        return self.status in _TERMINAL_STATUSES
 
 
 @dataclass(slots=True)
@@ -121,22 +136,34 @@ class SessionCardBuilder:
     primary_engine: str
 
     _badges: dict[str, AgentBadge] = field(default_factory=dict)
-    _activity: list[ActivityItem] = field(default_factory=list)
+    # Bounded to max_activity_items in __post_init__; old items fall off.
+    _activity: deque[ActivityItem] = field(default_factory=deque)
     _pending_inputs: dict[str, PendingInput] = field(default_factory=dict)
     _context_line: str | None = None
     _resume_line: str | None = None
     _status: Literal["working", "waiting_input", "done", "cancelled", "error"] = "working"
     _error_message: str | None = None
+    # Memoized build() outputs; reset to None by the mutators that affect them.
+    _sorted_badges: tuple[AgentBadge, ...] | None = None
+    _pending_snapshot: tuple[PendingInput, ...] | None = None
+    # Bumped by every mutator so consumers can skip unchanged rebuilds.
+    _revision: int = 0
 
     max_activity_items: int = 50
+    # Source of badge, activity and pending-input timestamps.
+    clock: Callable[[], float] = field(default=time.time, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        # Engine ids come from a tiny closed set; interning keeps the badge
+        # dict lookups and the primary-first sort on the identity fast path.
+        self.primary_engine = sys.intern(self.primary_engine)
+        self._activity = deque(self._activity, maxlen=self.max_activity_items)
         # Initialize primary engine badge
         self._badges[self.primary_engine] = AgentBadge(
             engine=self.primary_engine,
             status="active",
             step_count=0,
-            last_activity=time.time(),
+            last_activity=self.clock(),
         )
 
     def add_agent(
@@ -146,14 +173,17 @@ class SessionCardBuilder:
         status: Literal["active", "waiting", "done", "error"] = "active",
     ) -> None:
         """Add or update an agent badge."""
+        self._revision += 1
+        engine = sys.intern(engine)
         existing = self._badges.get(engine)
         step_count = existing.step_count if existing else 0
         self._badges[engine] = AgentBadge(
             engine=engine,
             status=status,
             step_count=step_count,
-            last_activity=time.time(),
+            last_activity=self.clock(),
         )
+        self._sorted_badges = None
 
     def update_agent_status(
         self,
@@ -161,32 +191,38 @@ class SessionCardBuilder:
         status: Literal["active", "waiting", "done", "error"],
     ) -> None:
         """Update an agent's status."""
+        self._revision += 1
+        engine = sys.intern(engine)
         if engine in self._badges:
             old = self._badges[engine]
             self._badges[engine] = AgentBadge(
                 engine=engine,
                 status=status,
                 step_count=old.step_count,
-                last_activity=time.time(),
+                last_activity=self.clock(),
             )
+            self._sorted_badges = None
 
     def increment_step(self, engine: str) -> None:
         """Increment an agent's step count."""
+        self._revision += 1
+        engine = sys.intern(engine)
         if engine in self._badges:
             old = self._badges[engine]
             self._badges[engine] = AgentBadge(
                 engine=engine,
                 status=old.status,
                 step_count=old.step_count + 1,
-                last_activity=time.time(),
+                last_activity=self.clock(),
             )
         else:
             self._badges[engine] = AgentBadge(
                 engine=engine,
                 status="active",
                 step_count=1,
-                last_activity=time.time(),
+                last_activity=self.clock(),
             )
+        self._sorted_badges = None
 
     def add_activity(
         self,
@@ -197,43 +233,47 @@ class SessionCardBuilder:
         detail: dict[str, Any] | None = None,
     ) -> None:
         """Add an activity item to the feed."""
+        self._revision += 1
         item = ActivityItem(
-            timestamp=time.time(),
-            engine=engine,
-            kind=kind,
+            timestamp=self.clock(),
+            engine=sys.intern(engine),
+            kind=sys.intern(kind),
             summary=summary,
             detail=detail,
         )
         self._activity.append(item)
 
-        # Trim old items if needed
-        if len(self._activity) > self.max_activity_items:
-            self._activity = self._activity[-self.max_activity_items :]
-
     def add_pending_input(self, event: InputRequestEvent) -> None:
         """Add a pending input request."""
+        self._revision += 1
         self._pending_inputs[event.request_id] = PendingInput(
             request_id=event.request_id,
             question=event.question,
-            source=event.source,
-            urgency=event.urgency,
+            source=sys.intern(event.source),
+            urgency=sys.intern(event.urgency),
             options=tuple(event.options) if event.options else None,
             context=event.context,
+            received_at=self.clock(),
         )
+        self._pending_snapshot = None
         self._status = "waiting_input"
 
     def remove_pending_input(self, request_id: str) -> None:
         """Remove a pending input (answered or skipped)."""
-        self._pending_inputs.pop(request_id, None)
+        self._revision += 1
+        if self._pending_inputs.pop(request_id, None) is not None:
+            self._pending_snapshot = None
         if not self._pending_inputs:
             self._status = "working"
 
     def set_context(self, context_line: str | None) -> None:
         """Set the context line."""
+        self._revision += 1
         self._context_line = context_line
 
     def set_resume(self, resume_line: str | None) -> None:
         """Set the resume line."""
+        self._revision += 1
         self._resume_line = resume_line
 
     def set_complete(
@@ -243,6 +283,7 @@ class SessionCardBuilder:
         error: str | None = None,
     ) -> None:
         """Mark the session as complete."""
+        self._revision += 1
         if error:
             self._status = "error"
             self._error_message = error
@@ -257,29 +298,48 @@ class SessionCardBuilder:
 
     def set_cancelled(self) -> None:
         """Mark the session as cancelled."""
+        self._revision += 1
         self._status = "cancelled"
 
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever the built state could differ."""
+        return self._revision
+
     def build(self, *, max_visible_activity: int = 5) -> SessionCardState:
         """Build an immutable SessionCardState."""
         # Sort badges: primary first, then by last activity
-        sorted_badges = sorted(
-            self._badges.values(),
-            key=lambda b: (b.engine != self.primary_engine, -(b.last_activity or 0)),
-        )
+        sorted_badges = self._sorted_badges
+        if sorted_badges is None:
+            primary = self.primary_engine
+            sorted_badges = self._sorted_badges = tuple(
+                sorted(
+                    self._badges.values(),
+                    key=lambda b: (b.engine != primary, -(b.last_activity or 0)),
+                )
+            )
+        pending_inputs = self._pending_snapshot
+        if pending_inputs is None:
+            pending_inputs = self._pending_snapshot = tuple(
+                self._pending_inputs.values()
+            )
 
         # Get recent activity
-        visible_activity = self._activity[-max_visible_activity:]
-        truncated = len(self._activity) > max_visible_activity
+        activity_total = len(self._activity)
+        visible_activity = tuple(
+            islice(self._activity, max(activity_total - max_visible_activity, 0), None)
+        )
+        truncated = activity_total > max_visible_activity
 
         return SessionCardState(
             session_id=self.session_id,
             started_at=self.started_at,
-            badges=tuple(sorted_badges),
+            badges=sorted_badges,
             primary_engine=self.primary_engine,
-            activity_items=tuple(visible_activity),
+            activity_items=visible_activity,
             activity_truncated=truncated,
-            activity_total=len(self._activity),
-            pending_inputs=tuple(self._pending_inputs.values()),
+            activity_total=activity_total,
+            pending_inputs=pending_inputs,
             context_line=self._context_line,
             resume_line=self._resume_line,
             status=self._status,
@@ -314,15 +374,35 @@ ACTIVITY_SYMBOLS: dict[str, str] = {
 }
 
 
+DEFAULT_BADGE_SYMBOL = "\u26AB"  # Black circle
+DEFAULT_ACTIVITY_SYMBOL = "\u2022"  # Bullet
+
+# Pre-rendered prefixes for the closed engine/status/kind sets, so the
+# per-frame formatters do a single lookup instead of rebuilding f-strings.
+_BADGE_PREFIXES: dict[tuple[str, str], str] = {
+    (engine, status): f"{color}{symbol}"
+    for engine, color in BADGE_SYMBOLS.items()
+    for status, symbol in STATUS_SYMBOLS.items()
+}
+_ACTIVITY_PREFIXES: dict[str, str] = {
+    kind: f"{symbol} " for kind, symbol in ACTIVITY_SYMBOLS.items()
+}
+_ENGINE_TAGS: dict[str, str] = {engine: f"[{engine}] " for engine in BADGE_SYMBOLS}
+
+
 def format_badge(badge: AgentBadge) -> str:
     """Format a badge for display in Telegram."""
-    color = BADGE_SYMBOLS.get(badge.engine, "\u26AB")  # Default: black circle
-    status = STATUS_SYMBOLS.get(badge.status, "")
-    return f"{color}{status}{badge.engine}"
+    prefix = _BADGE_PREFIXES.get((badge.engine, badge.status))
+    if prefix is None:
+        color = BADGE_SYMBOLS.get(badge.engine, DEFAULT_BADGE_SYMBOL)
+        prefix = color + STATUS_SYMBOLS.get(badge.status, "")
+    return prefix + badge.engine
 
 
 def format_activity_item(item: ActivityItem, *, show_engine: bool = True) -> str:
     """Format an activity item for display."""
-    symbol = ACTIVITY_SYMBOLS.get(item.kind, "\u2022")  # Default: bullet
-    engine_tag = f"[{item.engine}] " if show_engine else ""
-    return f"{symbol} {engine_tag}{item.summary}"
+    prefix = _ACTIVITY_PREFIXES.get(item.kind) or f"{DEFAULT_ACTIVITY_SYMBOL} "
+    if not show_engine:
+        return prefix + item.summary
+    engine_tag = _ENGINE_TAGS.get(item.engine) or f"[{item.engine}] "
+    return prefix + engine_tag + item.summary
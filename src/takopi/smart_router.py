@@ -7,10 +7,15 @@ or multi-agent orchestration (liaison) without requiring explicit commands.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Literal
 
+import anyio
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .model import EngineId
     from .router import AutoRouter
 
@@ -25,42 +30,199 @@ class RoutingDecision:
     suggested_multi_agent: bool  # Whether liaison might be better
 
 
+# Pattern sources with their weights. They are matched against the lowercased
+# prompt, so they are written in lowercase and compiled without re.I (no
+# per-character case folding). Compilation is deferred to _scan_tables().
+
 # Patterns suggesting multi-agent orchestration (liaison)
-_LIAISON_PATTERNS: list[tuple[re.Pattern[str], float]] = [
+_LIAISON_PATTERNS: list[tuple[str, float]] = [
     # Explicit multi-step/multi-file patterns
-    (re.compile(r"refactor\s+(?:all|multiple|across|the\s+entire)\b", re.I), 0.85),
-    (re.compile(r"update\s+(?:all|every|each)\s+\w+\s+files?\b", re.I), 0.80),
-    (re.compile(r"migrate\s+(?:from|to|the)\b", re.I), 0.75),
-    (re.compile(r"coordinate\b", re.I), 0.90),
-    (re.compile(r"orchestrate\b", re.I), 0.90),
-    (re.compile(r"in\s+parallel\b", re.I), 0.85),
+    (r"refactor\s+(?:all|multiple|across|the\s+entire)\b", 0.85),
+    (r"update\s+(?:all|every|each)\s+\w+\s+files?\b", 0.80),
+    (r"migrate\s+(?:from|to|the)\b", 0.75),
+    (r"coordinate\b", 0.90),
+    (r"orchestrate\b", 0.90),
+    (r"in\s+parallel\b", 0.85),
     # Multi-component work
-    (re.compile(r"(?:and|then)\s+(?:run|execute)\s+(?:tests?|lint)", re.I), 0.70),
-    (re.compile(r"(?:build|implement)\s+.+\s+(?:and|with)\s+tests?", re.I), 0.65),
-    (re.compile(r"full\s+(?:stack|feature|implementation)", re.I), 0.70),
+    (r"(?:and|then)\s+(?:run|execute)\s+(?:tests?|lint)", 0.70),
+    # The gap is bounded: an unbounded .+ backtracks to the end of the line
+    # from every "build", which is quadratic on long pasted text.
+    (r"(?:build|implement)\s+.{1,200}\s+(?:and|with)\s+tests?", 0.65),
+    (r"full\s+(?:stack|feature|implementation)", 0.70),
     # Large scope indicators
-    (re.compile(r"entire\s+(?:codebase|project|application)", re.I), 0.80),
-    (re.compile(r"(?:multiple|several|many)\s+(?:files?|components?|modules?)", re.I), 0.75),
-    (re.compile(r"across\s+(?:the\s+)?(?:codebase|project)", re.I), 0.80),
+    (r"entire\s+(?:codebase|project|application)", 0.80),
+    (r"(?:multiple|several|many)\s+(?:files?|components?|modules?)", 0.75),
+    (r"across\s+(?:the\s+)?(?:codebase|project)", 0.80),
 ]
 
 # Patterns suggesting simple single-agent tasks
-_SIMPLE_PATTERNS: list[tuple[re.Pattern[str], float]] = [
+_SIMPLE_PATTERNS: list[tuple[str, float]] = [
     # Quick fixes
-    (re.compile(r"^fix\s+(?:the|this|a)\s+\w+", re.I), 0.85),
-    (re.compile(r"^(?:add|update|change|remove)\s+(?:the|this|a)\s+\w+", re.I), 0.75),
-    (re.compile(r"typo\b", re.I), 0.90),
+    (r"^fix\s+(?:the|this|a)\s+\w+", 0.85),
+    (r"^(?:add|update|change|remove)\s+(?:the|this|a)\s+\w+", 0.75),
+    (r"typo\b", 0.90),
     # Questions/explanations
-    (re.compile(r"^what\s+(?:is|does|are)\b", re.I), 0.90),
-    (re.compile(r"^explain\b", re.I), 0.90),
-    (re.compile(r"^how\s+(?:do|does|to)\b", re.I), 0.85),
-    (re.compile(r"^why\s+(?:is|does|do)\b", re.I), 0.85),
+    (r"^what\s+(?:is|does|are)\b", 0.90),
+    (r"^explain\b", 0.90),
+    (r"^how\s+(?:do|does|to)\b", 0.85),
+    (r"^why\s+(?:is|does|do)\b", 0.85),
     # Single file operations
-    (re.compile(r"^read\s+(?:the\s+)?(?:file|code)", re.I), 0.90),
-    (re.compile(r"in\s+(?:this|the)\s+file\b", re.I), 0.80),
+    (r"^read\s+(?:the\s+)?(?:file|code)", 0.90),
+    (r"in\s+(?:this|the)\s+file\b", 0.80),
 ]
 
 
+# Literals every pattern above requires (for alternations, each branch's).
+# A prompt containing none of them cannot match, so the lookahead scan, which
+# tries every alternative at every position, is skipped.
+_KEYWORDS = (
+    r"refactor|update|migrate|coordinate|orchestrate|parallel|test|lint|full"
+    r"|entire|multiple|several|many|across"
+    r"|fix|add|change|remove|typo|what|explain|how|why|read|file"
+)
+
+
+def _combine_patterns(
+    liaison: list[tuple[str, float]],
+    simple: list[tuple[str, float]],
+) -> tuple[re.Pattern[str], tuple[bool, ...], tuple[float, ...]]:
+    """Fold both pattern lists into one regex so a prompt is scanned once.
+
+    Each alternative is a capturing lookahead, so matches may overlap and every
+    start position is tried. Alternatives are ordered by descending weight, so
+    the group reported at a position is the heaviest one matching there; no
+    liaison and simple pattern can match from the same position (where they
+    share a leading word, as with ``update`` or ``in``, the next word differs).
+    Returns the regex plus parallel ``is_liaison`` and ``weight`` tuples, both
+    indexed by ``match.lastindex`` (slot 0 is unused).
+    """
+    tagged = [(source, True, weight) for source, weight in liaison]
+    tagged += [(source, False, weight) for source, weight in simple]
+    tagged.sort(key=lambda item: item[2], reverse=True)
+    combined = re.compile("|".join(f"(?=({source}))" for source, _, _ in tagged))
+    assert combined.groups == len(tagged)
+    is_liaison = (False, *(is_liaison for _, is_liaison, _ in tagged))
+    weights = (0.0, *(weight for _, _, weight in tagged))
+    return combined, is_liaison, weights
+
+
+# ^-anchored patterns can only match at position 0, so they are kept out of
+# the lookahead scan and tried with a single match() when the prompt starts
+# with one of their leading words.
+_ANCHORED_PATTERNS = [(p, w) for p, w in _SIMPLE_PATTERNS if p[0] == "^"]
+_FLOATING_PATTERNS = [(p, w) for p, w in _SIMPLE_PATTERNS if p[0] != "^"]
+_ANCHOR_PREFIXES = (
+    "fix",
+    "add",
+    "update",
+    "change",
+    "remove",
+    "what",
+    "explain",
+    "how",
+    "why",
+    "read",
+)
+
+_LIAISON_TOP = max(weight for _, weight in _LIAISON_PATTERNS)
+_SIMPLE_TOP = max(weight for _, weight in _FLOATING_PATTERNS)
+
+
+@dataclass(frozen=True, slots=True)
+class _ScanTables:
+    keywords: re.Pattern[str]
+    anchored: re.Pattern[str]
+    anchored_weights: tuple[float, ...]
+    scan: re.Pattern[str]
+    is_liaison: tuple[bool, ...]
+    weights: tuple[float, ...]
+
+
+@cache
+def _scan_tables() -> _ScanTables:
+    """Compile the scan regexes on first use rather than at import.
+
+    The module is imported whether or not smart routing is enabled.
+    """
+    anchored, _, anchored_weights = _combine_patterns([], _ANCHORED_PATTERNS)
+    scan, is_liaison, weights = _combine_patterns(_LIAISON_PATTERNS, _FLOATING_PATTERNS)
+    return _ScanTables(
+        keywords=re.compile(_KEYWORDS),
+        anchored=anchored,
+        anchored_weights=anchored_weights,
+        scan=scan,
+        is_liaison=is_liaison,
+        weights=weights,
+    )
+
+
+def _score_prompt_uncached(prompt: str) -> tuple[float, float]:
+    tables = _scan_tables()
+    if tables.keywords.search(prompt) is None:
+        return 0.0, 0.0
+    liaison_max = simple_max = 0.0
+    if prompt.startswith(_ANCHOR_PREFIXES):
+        anchored = tables.anchored.match(prompt)
+        if anchored is not None:
+            simple_max = tables.anchored_weights[anchored.lastindex or 0]
+    is_liaison = tables.is_liaison
+    weights = tables.weights
+    for match in tables.scan.finditer(prompt):
+        index = match.lastindex or 0
+        weight = weights[index]
+        if is_liaison[index]:
+            liaison_max = max(liaison_max, weight)
+        else:
+            simple_max = max(simple_max, weight)
+        # Nothing later can raise either score once both tops have matched.
+        if liaison_max >= _LIAISON_TOP and simple_max >= _SIMPLE_TOP:
+            break
+    return liaison_max, simple_max
+
+
+_score_prompt_cached = lru_cache(maxsize=512)(_score_prompt_uncached)
+
+# Long prompts are rarely repeated verbatim; keep them out of the cache so it
+# never pins large pastes in memory.
+_SCORE_CACHE_MAX_PROMPT = 1024
+
+# The shortest text any pattern can match is "typo". Shorter prompts ("ok",
+# "yes", "/go") cannot score, so they skip lowercasing and the cache lookup.
+_MIN_MATCH_LEN = 4
+
+
+def _score_prompt(prompt: str) -> tuple[float, float]:
+    """Return ``(liaison_score, simple_score)``, memoized for short prompts."""
+    if len(prompt) < _MIN_MATCH_LEN:
+        return 0.0, 0.0
+    # One normalized copy serves the cache key, the prefix gate and the scan;
+    # stripping lets ^-anchored patterns see past leading whitespace.
+    prompt = prompt.strip().lower()
+    if len(prompt) > _SCORE_CACHE_MAX_PROMPT:
+        return _score_prompt_uncached(prompt)
+    return _score_prompt_cached(prompt)
+
+
+@lru_cache(maxsize=64)
+def _decision(
+    engine: str,
+    reason: Literal["explicit", "resume", "heuristic", "default"],
+    confidence: float,
+    suggested_multi_agent: bool = False,
+) -> RoutingDecision:
+    """Shared RoutingDecision instance for a given set of field values.
+
+    Confidences come from a fixed set of pattern weights, so the distinct
+    decisions are few; RoutingDecision is frozen, so instances can be reused.
+    """
+    return RoutingDecision(
+        engine=engine,
+        reason=reason,
+        confidence=confidence,
+        suggested_multi_agent=suggested_multi_agent,
+    )
+
+
 @dataclass(slots=True)
 class SmartRouter:
     """Analyzes requests to suggest optimal engine routing.
@@ -72,6 +234,10 @@ class SmartRouter:
     router: AutoRouter
     liaison_threshold: float = 0.70
     suggest_only: bool = True  # If True, only suggest, don't auto-switch
+    # AutoRouter entries are fixed at construction; remember the liaison check
+    # per router instance instead of rebuilding engine_ids on every analyze().
+    _liaison_router: AutoRouter | None = field(default=None, init=False, repr=False)
+    _has_liaison: bool = field(default=False, init=False, repr=False)
 
     def analyze(
         self,
@@ -92,25 +258,62 @@ class SmartRouter:
         """
         # Explicit directive takes priority
         if explicit_engine is not None:
-            return RoutingDecision(
-                engine=explicit_engine,
-                reason="explicit",
-                confidence=1.0,
-                suggested_multi_agent=False,
-            )
+            return _decision(explicit_engine, "explicit", 1.0)
 
         # Resume token takes priority
         if resume_engine is not None:
-            return RoutingDecision(
-                engine=resume_engine,
-                reason="resume",
-                confidence=1.0,
-                suggested_multi_agent=False,
-            )
+            return _decision(resume_engine, "resume", 1.0)
 
         # Analyze prompt content
-        liaison_score = self._score_liaison_patterns(prompt)
-        simple_score = self._score_simple_patterns(prompt)
+        liaison_score, simple_score = _score_prompt(prompt)
+        return self._decide(liaison_score, simple_score)
+
+    async def analyze_async(
+        self,
+        prompt: str,
+        *,
+        explicit_engine: str | None = None,
+        resume_engine: str | None = None,
+    ) -> RoutingDecision:
+        """Like analyze(), but score long prompts in a worker thread.
+
+        Prompts short enough for the score cache are scored inline, since a
+        thread hop costs more than the lookup or scan they need.
+        """
+        if (
+            explicit_engine is not None
+            or resume_engine is not None
+            or len(prompt) <= _SCORE_CACHE_MAX_PROMPT
+        ):
+            return self.analyze(
+                prompt, explicit_engine=explicit_engine, resume_engine=resume_engine
+            )
+        liaison_score, simple_score = await anyio.to_thread.run_sync(
+            _score_prompt, prompt
+        )
+        return self._decide(liaison_score, simple_score)
+
+    def analyze_many(self, prompts: Iterable[str]) -> list[RoutingDecision]:
+        """Analyze a batch of prompts (replays, log analysis) in one call.
+
+        Equivalent to calling analyze() on each prompt without directives;
+        repeated prompts in the batch are scored once.
+        """
+        scores: dict[str, tuple[float, float]] = {}
+        decisions: list[RoutingDecision] = []
+        for prompt in prompts:
+            score = scores.get(prompt)
+            if score is None:
+                score = scores[prompt] = _score_prompt(prompt)
+            decisions.append(self._decide(*score))
+        return decisions
+
+    def _decide(self, liaison_score: float, simple_score: float) -> RoutingDecision:
+        """Turn pattern scores into a routing decision."""
+        # Nothing matched, the common case: liaison cannot beat a zero simple
+        # score, and the confidence floor applies as-is.
+        if liaison_score == 0.0 and simple_score == 0.0:
+            return _decision(self.router.default_engine, "default", 0.5)
 
         # Determine if liaison is suggested
         suggested_multi_agent = (
@@ -121,40 +324,23 @@ class SmartRouter:
 
         # Pick engine based on analysis
         if suggested_multi_agent and not self.suggest_only:
-            return RoutingDecision(
-                engine="liaison",
-                reason="heuristic",
-                confidence=liaison_score,
-                suggested_multi_agent=True,
-            )
+            return _decision("liaison", "heuristic", liaison_score, True)
 
         # Default to router's default engine
-        return RoutingDecision(
-            engine=self.router.default_engine,
-            reason="default",
-            confidence=max(simple_score, 0.5),
-            suggested_multi_agent=suggested_multi_agent,
+        return _decision(
+            self.router.default_engine,
+            "default",
+            max(simple_score, 0.5),
+            suggested_multi_agent,
         )
 
-    def _score_liaison_patterns(self, prompt: str) -> float:
-        """Score how much a prompt suggests multi-agent work."""
-        max_score = 0.0
-        for pattern, weight in _LIAISON_PATTERNS:
-            if pattern.search(prompt):
-                max_score = max(max_score, weight)
-        return max_score
-
-    def _score_simple_patterns(self, prompt: str) -> float:
-        """Score how much a prompt suggests simple single-agent work."""
-        max_score = 0.0
-        for pattern, weight in _SIMPLE_PATTERNS:
-            if pattern.search(prompt):
-                max_score = max(max_score, weight)
-        return max_score
-
     def _has_liaison_engine(self) -> bool:
         """Check if liaison engine is available."""
-        return "liaison" in self.router.engine_ids
+        router = self.router
+        if router is not self._liaison_router:
+            self._has_liaison = "liaison" in router.engine_ids
+            self._liaison_router = router
+        return self._has_liaison
 
 
 def create_smart_router(
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Literal, cast
 
 from ..logging import get_logger
@@ -13,6 +15,7 @@ from ..transport_runtime import TransportRuntime
 from ..context import RunContext
 from ..model import InputRequestEvent, ResumeToken
 from ..session_card import (
+    PendingInput,
     SessionCardState,
     format_badge,
     format_activity_item,
@@ -58,10 +61,17 @@ CLEAR_MARKUP = {"inline_keyboard": []}
 # Input request callback prefixes
 INPUT_ANSWER_PREFIX = "takopi:answer:"
 INPUT_AUTO_PREFIX = "takopi:auto:"
+_INPUT_PREFIXES = (INPUT_ANSWER_PREFIX, INPUT_AUTO_PREFIX)
+_CALLBACK_ROOT = "takopi:"
+_INPUT_ACTIONS = frozenset({"answer", "auto"})
 
 
+@lru_cache(maxsize=256)
 def _input_request_markup(request_id: str) -> dict:
-    """Build inline keyboard for input request messages."""
+    """Build inline keyboard for input request messages.
+
+    Shared per request id, like CANCEL_MARKUP; callers must not mutate it.
+    """
     return {
         "inline_keyboard": [
             [{"text": "Answer", "callback_data": f"{INPUT_ANSWER_PREFIX}{request_id}"}],
@@ -75,15 +85,25 @@ def _input_request_markup(request_id: str) -> dict:
     }
 
 
+_URGENCY_INDICATORS: dict[str, str] = {
+    "low": "",
+    "normal": "",
+    "high": "[!] ",
+    "critical": "[!!] ",
+}
+
+_STATUS_LABELS: dict[str, str] = {
+    "working": "Working",
+    "waiting_input": "Waiting for input",
+    "done": "Done",
+    "cancelled": "Cancelled",
+    "error": "Error",
+}
+
+
 def _urgency_indicator(urgency: str) -> str:
     """Get visual indicator for urgency level."""
-    indicators = {
-        "low": "",
-        "normal": "",
-        "high": "[!] ",
-        "critical": "[!!] ",
-    }
-    return indicators.get(urgency, "")
+    return _URGENCY_INDICATORS.get(urgency, "")
 
 
 # Session card callback prefixes
@@ -91,20 +111,56 @@ CARD_PAUSE_CALLBACK = "takopi:pause"
 CARD_EXPAND_CALLBACK = "takopi:expand"
 CARD_CONTINUE_CALLBACK = "takopi:continue"
 
+# Fixed session card buttons. The markup is only ever serialized, never
+# mutated, so every render can share these dicts.
+_PAUSE_BUTTON = {"text": "\u23f8 Pause", "callback_data": CARD_PAUSE_CALLBACK}
+_CANCEL_BUTTON = {"text": "\u2716 Cancel", "callback_data": CANCEL_CALLBACK_DATA}
+_CONTINUE_BUTTON = {"text": "\u25b6 Continue", "callback_data": CARD_CONTINUE_CALLBACK}
+_RESUME_BUTTON = {"text": "\u21a9 Resume", "callback_data": CARD_CONTINUE_CALLBACK}
+_SHOW_MORE_BUTTON = {"text": "\u2195 Show more", "callback_data": CARD_EXPAND_CALLBACK}
+_SHOW_LESS_BUTTON = {"text": "\u2195 Show less", "callback_data": CARD_EXPAND_CALLBACK}
+
 
 def _format_elapsed(seconds: float) -> str:
     """Format elapsed time for display."""
+    return _format_elapsed_seconds(int(seconds))
+
+
+# Cards re-render many times within the same second; the display only has
+# whole-second resolution, so cache on the truncated value.
+@lru_cache(maxsize=4096)
+def _format_elapsed_seconds(seconds: int) -> str:
     if seconds < 60:
-        return f"{int(seconds)}s"
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+        return f"{seconds}s"
+    minutes, secs = divmod(seconds, 60)
     if minutes < 60:
         return f"{minutes}m {secs}s"
-    hours = int(minutes // 60)
-    mins = minutes % 60
+    hours, mins = divmod(minutes, 60)
     return f"{hours}h {mins}m"
 
 
+def _format_pending_input(index: int, inp: PendingInput, *, multi_agent: bool) -> str:
+    """Format one pending input line for the session card body."""
+    source_tag = f"[{inp.source}]" if multi_agent else ""
+    urgency = _urgency_indicator(inp.urgency)
+    return f"{index}. {urgency}{source_tag} {inp.short_question}"
+
+
+@lru_cache(maxsize=256)
+def _input_response_buttons(request_id: str, source: str) -> tuple[dict, dict]:
+    """Answer/Skip buttons for one pending input, built once per request."""
+    return (
+        {
+            "text": f"\u270f Answer [{source}]",
+            "callback_data": f"{INPUT_ANSWER_PREFIX}{request_id}",
+        },
+        {
+            "text": "\u23ed Skip",
+            "callback_data": f"{INPUT_AUTO_PREFIX}{request_id}",
+        },
+    )
+
+
 def _build_session_card_markup(
     state: SessionCardState,
     *,
@@ -114,55 +170,57 @@ def _build_session_card_markup(
     rows: list[list[dict]] = []
 
     # Row 1: Control buttons
-    control_row: list[dict] = []
     if state.status == "working":
-        control_row.append({
-            "text": "\u23F8 Pause",
-            "callback_data": CARD_PAUSE_CALLBACK,
-        })
-        control_row.append({
-            "text": "\u2716 Cancel",
-            "callback_data": CANCEL_CALLBACK_DATA,
-        })
+        rows.append([_PAUSE_BUTTON, _CANCEL_BUTTON])
     elif state.status == "waiting_input" and not state.pending_inputs:
-        control_row.append({
-            "text": "\u25B6 Continue",
-            "callback_data": CARD_CONTINUE_CALLBACK,
-        })
+        rows.append([_CONTINUE_BUTTON])
     elif state.is_complete:
-        control_row.append({
-            "text": "\u21A9 Resume",
-            "callback_data": CARD_CONTINUE_CALLBACK,
-        })
-
-    if control_row:
-        rows.append(control_row)
+        rows.append([_RESUME_BUTTON])
 
     # Row 2+: Input response buttons (max 2 shown)
-    for inp in state.pending_inputs[:2]:
-        short_id = inp.request_id[-6:] if len(inp.request_id) > 6 else inp.request_id
-        rows.append([
-            {
-                "text": f"\u270F Answer [{inp.source}]",
-                "callback_data": f"{INPUT_ANSWER_PREFIX}{inp.request_id}",
-            },
-            {
-                "text": "\u23ED Skip",
-                "callback_data": f"{INPUT_AUTO_PREFIX}{inp.request_id}",
-            },
-        ])
+    rows.extend(
+        list(_input_response_buttons(inp.request_id, inp.source))
+        for inp in state.pending_inputs[:2]
+    )
 
     # Row N: Activity toggle (if there's more to show)
     if state.activity_truncated:
-        toggle_text = "\u2195 Show less" if expanded else "\u2195 Show more"
-        rows.append([{
-            "text": toggle_text,
-            "callback_data": CARD_EXPAND_CALLBACK,
-        }])
+        rows.append([_SHOW_LESS_BUTTON if expanded else _SHOW_MORE_BUTTON])
 
     return {"inline_keyboard": rows}
 
 
+# Rendered session cards kept per presenter. Cards are re-rendered on every
+# event, and bursts of events often leave the visible card unchanged.
+_CARD_CACHE_SIZE = 256
+
+
+def _session_card_key(
+    state: SessionCardState, elapsed: str, expanded: bool
+) -> tuple[object, ...]:
+    """Everything render_session_card reads, as a hashable cache key.
+
+    Identity fields, timestamps and activity ``detail`` dicts are left out:
+    they never reach the rendered text or markup.
+    """
+    return (
+        elapsed,
+        expanded,
+        state.status,
+        state.error_message,
+        state.context_line,
+        state.resume_line,
+        state.activity_truncated,
+        state.activity_total,
+        tuple((b.engine, b.status, b.step_count) for b in state.badges),
+        tuple((a.engine, a.kind, a.summary) for a in state.activity_items),
+        tuple(
+            (p.request_id, p.question, p.source, p.urgency)
+            for p in state.pending_inputs
+        ),
+    )
+
+
 class TelegramPresenter:
     def __init__(
         self,
@@ -172,6 +230,9 @@ class TelegramPresenter:
     ) -> None:
         self._formatter = formatter or MarkdownFormatter()
         self._message_overflow = message_overflow
+        self._card_cache: OrderedDict[tuple[object, ...], RenderedMessage] = (
+            OrderedDict()
+        )
 
     def render_progress(
         self,
@@ -230,21 +291,16 @@ class TelegramPresenter:
         context_line: str | None = None,
     ) -> RenderedMessage:
         """Render an input request for Telegram display."""
-        urgency_prefix = _urgency_indicator(event.urgency)
-        header = f"{urgency_prefix}Question from {event.source}"
-
-        body_parts = [event.question]
+        header = f"{_urgency_indicator(event.urgency)}Question from {event.source}"
 
+        body = event.question
         if event.options:
             options_text = "\n".join(
-                f"  {i + 1}. {opt}" for i, opt in enumerate(event.options)
+                [f"  {i}. {opt}" for i, opt in enumerate(event.options, 1)]
             )
-            body_parts.append(f"\nOptions:\n{options_text}")
-
+            body = f"{body}\n\nOptions:\n{options_text}"
         if event.context:
-            body_parts.append(f"\n(Context: {event.context})")
-
-        body = "\n".join(body_parts)
+            body = f"{body}\n\n(Context: {event.context})"
 
         parts = MarkdownParts(header=header, body=body)
         text, entities = prepare_telegram(parts)
@@ -280,37 +336,46 @@ class TelegramPresenter:
         Returns:
             RenderedMessage ready to send/edit
         """
-        # Build header: badges + status line
-        header_parts = []
-
-        # Agent badges row
-        if state.badges:
-            badges_line = " ".join(format_badge(b) for b in state.badges)
-            header_parts.append(badges_line)
-
+        elapsed = _format_elapsed(elapsed_s)
+        key = _session_card_key(state, elapsed, expanded)
+        cached = self._card_cache.get(key)
+        if cached is not None:
+            self._card_cache.move_to_end(key)
+            return cached
+        rendered = self._render_session_card(state, elapsed=elapsed, expanded=expanded)
+        self._card_cache[key] = rendered
+        if len(self._card_cache) > _CARD_CACHE_SIZE:
+            self._card_cache.popitem(last=False)
+        return rendered
+
+    def _render_session_card(
+        self,
+        state: SessionCardState,
+        *,
+        elapsed: str,
+        expanded: bool,
+    ) -> RenderedMessage:
         # Status line
         status_parts = []
-        status_label = {
-            "working": "Working",
-            "waiting_input": "Waiting for input",
-            "done": "Done",
-            "cancelled": "Cancelled",
-            "error": "Error",
-        }.get(state.status, state.status)
-        status_parts.append(status_label)
+        status_parts.append(_STATUS_LABELS.get(state.status, state.status))
 
         if len(state.badges) > 1:
             status_parts.append(f"{len(state.badges)} agents")
 
-        status_parts.append(_format_elapsed(elapsed_s))
+        status_parts.append(elapsed)
 
         total_steps = sum(b.step_count for b in state.badges)
         if total_steps > 0:
             status_parts.append(f"{total_steps} steps")
 
-        header_parts.append(" \u00b7 ".join(status_parts))  # · separator
+        status_line = " \u00b7 ".join(status_parts)  # · separator
 
-        header = "\n".join(header_parts)
+        # Header: agent badges row above the status line
+        if state.badges:
+            badges_line = " ".join([format_badge(b) for b in state.badges])
+            header = f"{badges_line}\n{status_line}"
+        else:
+            header = status_line
 
         # Build body: activity feed + pending inputs
         body_parts = []
@@ -318,9 +383,10 @@ class TelegramPresenter:
         # Activity feed
         if state.activity_items:
             show_engine = state.is_multi_agent
-            activity_lines = []
-            for item in state.activity_items:
-                activity_lines.append(format_activity_item(item, show_engine=show_engine))
+            activity_lines = [
+                format_activity_item(item, show_engine=show_engine)
+                for item in state.activity_items
+            ]
             if state.activity_truncated and not expanded:
                 remaining = state.activity_total - len(state.activity_items)
                 activity_lines.append(f"... ({remaining} more)")
@@ -328,13 +394,13 @@ class TelegramPresenter:
 
         # Pending inputs section
         if state.pending_inputs:
-            input_lines = ["\u2753 Waiting for input:"]  # ❓
-            for i, inp in enumerate(state.pending_inputs, 1):
-                urgency = _urgency_indicator(inp.urgency)
-                source_tag = f"[{inp.source}]" if state.is_multi_agent else ""
-                q = inp.question[:80] + "..." if len(inp.question) > 80 else inp.question
-                input_lines.append(f"{i}. {urgency}{source_tag} {q}")
-            body_parts.append("\n".join(input_lines))
+            multi_agent = state.is_multi_agent
+            input_lines = [
+                _format_pending_input(i, inp, multi_agent=multi_agent)
+                for i, inp in enumerate(state.pending_inputs, 1)
+            ]
+            # ❓ heading above the numbered questions
+            body_parts.append("\u2753 Waiting for input:\n" + "\n".join(input_lines))
 
         body = "\n\n".join(body_parts) if body_parts else None
 
@@ -362,6 +428,9 @@ class TelegramPresenter:
         )
 
 
+# Progress labels come from a handful of literals ("working", "`cancelled`",
+# ...), so every call after the first is a single cache hit.
+@lru_cache(maxsize=64)
 def _is_cancelled_label(label: str) -> bool:
     stripped = label.strip()
     if stripped.startswith("`") and stripped.endswith("`") and len(stripped) >= 2:
@@ -413,12 +482,13 @@ class TelegramTransport:
         notify: bool,
     ) -> None:
         for followup in followups:
+            extra = followup.extra
             await self._bot.send_message(
                 chat_id=chat_id,
                 text=followup.text,
-                entities=followup.extra.get("entities"),
-                parse_mode=followup.extra.get("parse_mode"),
-                reply_markup=followup.extra.get("reply_markup"),
+                entities=extra.get("entities"),
+                parse_mode=extra.get("parse_mode"),
+                reply_markup=extra.get("reply_markup"),
                 reply_to_message_id=reply_to_message_id,
                 message_thread_id=message_thread_id,
                 disable_notification=not notify,
@@ -435,6 +505,7 @@ class TelegramTransport:
         options: SendOptions | None = None,
     ) -> MessageRef | None:
         chat_id = cast(int, channel_id)
+        extra = message.extra
         reply_to_message_id: int | None = None
         replace_message_id: int | None = None
         message_thread_id: int | None = None
@@ -458,21 +529,17 @@ class TelegramTransport:
             )
         else:
             reply_to_message_id = cast(
-                int | None,
-                message.extra.get("followup_reply_to_message_id"),
-            )
-            message_thread_id = cast(
-                int | None,
-                message.extra.get("followup_thread_id"),
+                int | None, extra.get("followup_reply_to_message_id")
             )
-            notify = bool(message.extra.get("followup_notify", True))
+            message_thread_id = cast(int | None, extra.get("followup_thread_id"))
+            notify = bool(extra.get("followup_notify", True))
         followups = self._extract_followups(message)
         sent = await self._bot.send_message(
             chat_id=chat_id,
             text=message.text,
-            entities=message.extra.get("entities"),
-            parse_mode=message.extra.get("parse_mode"),
-            reply_markup=message.extra.get("reply_markup"),
+            entities=extra.get("entities"),
+            parse_mode=extra.get("parse_mode"),
+            reply_markup=extra.get("reply_markup"),
             reply_to_message_id=reply_to_message_id,
             message_thread_id=message_thread_id,
             replace_message_id=replace_message_id,
@@ -506,29 +573,25 @@ class TelegramTransport:
     ) -> MessageRef | None:
         chat_id = cast(int, ref.channel_id)
         message_id = cast(int, ref.message_id)
-        entities = message.extra.get("entities")
-        parse_mode = message.extra.get("parse_mode")
-        reply_markup = message.extra.get("reply_markup")
+        extra = message.extra
         followups = self._extract_followups(message)
         edited = await self._bot.edit_message_text(
             chat_id=chat_id,
             message_id=message_id,
             text=message.text,
-            entities=entities,
-            parse_mode=parse_mode,
-            reply_markup=reply_markup,
+            entities=extra.get("entities"),
+            parse_mode=extra.get("parse_mode"),
+            reply_markup=extra.get("reply_markup"),
             wait=wait,
         )
         if edited is None:
             return ref if not wait else None
         if followups:
             reply_to_message_id = cast(
-                int | None, message.extra.get("followup_reply_to_message_id")
+                int | None, extra.get("followup_reply_to_message_id")
             )
-            message_thread_id = cast(
-                int | None, message.extra.get("followup_thread_id")
-            )
-            notify = bool(message.extra.get("followup_notify", True))
+            message_thread_id = cast(int | None, extra.get("followup_thread_id"))
+            notify = bool(extra.get("followup_notify", True))
             await self._send_followups(
                 chat_id=chat_id,
                 followups=followups,
@@ -685,7 +748,7 @@ async def run_main_loop(
 
 def is_input_callback(data: str) -> bool:
     """Check if callback data is for an input request."""
-    return data.startswith(INPUT_ANSWER_PREFIX) or data.startswith(INPUT_AUTO_PREFIX)
+    return data.startswith(_INPUT_PREFIXES)
 
 
 def parse_input_callback(data: str) -> tuple[str, str] | None:
@@ -694,11 +757,12 @@ def parse_input_callback(data: str) -> tuple[str, str] | None:
     Returns:
         Tuple of ("answer" | "auto", request_id) or None if invalid
     """
-    if data.startswith(INPUT_ANSWER_PREFIX):
-        return ("answer", data[len(INPUT_ANSWER_PREFIX) :])
-    if data.startswith(INPUT_AUTO_PREFIX):
-        return ("auto", data[len(INPUT_AUTO_PREFIX) :])
-    return None
+    if not data.startswith(_CALLBACK_ROOT):
+        return None
+    action, sep, request_id = data[len(_CALLBACK_ROOT) :].partition(":")
+    if not sep or action not in _INPUT_ACTIONS:
+        return None
+    return (action, request_id)
 
 
 async def handle_callback_input_response(
@@ -727,10 +791,9 @@ async def handle_callback_input_response(
     action, request_id = parsed
 
     # Find the running task with this pending input
-    for progress_ref, task in running_tasks.items():
-        if request_id in task.pending_inputs:
-            pending = task.pending_inputs[request_id]
-
+    for task in running_tasks.values():
+        pending = task.pending_inputs.get(request_id)
+        if pending is not None:
             if action == "auto":
                 # Let the liaison handle it - just acknowledge
                 logger.info(
@@ -739,7 +802,7 @@ async def handle_callback_input_response(
                     question=pending.question,
                 )
                 await cfg.bot.answer_callback_query(
-                    callback_query_id=query.id,
+                    callback_query_id=query.callback_query_id,
                     text="Letting liaison decide...",
                 )
                 # Remove the pending request without sending a response
@@ -750,7 +813,7 @@ async def handle_callback_input_response(
                 if user_response is None:
                     # Prompt user to reply with their answer
                     await cfg.bot.answer_callback_query(
-                        callback_query_id=query.id,
+                        callback_query_id=query.callback_query_id,
                         text="Reply to this message with your answer",
                         show_alert=True,
                     )
@@ -770,14 +833,14 @@ async def handle_callback_input_response(
 
                 task.pending_inputs.pop(request_id, None)
                 await cfg.bot.answer_callback_query(
-                    callback_query_id=query.id,
+                    callback_query_id=query.callback_query_id,
                     text="Response sent",
                 )
                 return
 
     # Request not found
     await cfg.bot.answer_callback_query(
-        callback_query_id=query.id,
+        callback_query_id=query.callback_query_id,
         text="Request no longer active",
         show_alert=True,
     )
@@ -7,6 +7,11 @@ from takopi.runners.mock import ScriptRunner
 from tests.telegram_fakes import FakeBot, FakeTransport, make_cfg as build_cfg
 
 
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
 @pytest.fixture
 def fake_transport() -> FakeTransport:
     return FakeTransport()
@@ -3,7 +3,11 @@
 import pytest
 import re
 
-from takopi.runners.escalation import EscalationPolicy
+from takopi.runners.escalation import (
+    _DECISION_CACHE_SIZE,
+    EscalationPolicy,
+    _fuse_patterns,
+)
 
 
 class TestEscalationPolicy:
@@ -164,6 +168,20 @@ class TestEscalationPolicy:
         assert policy.auto_response("Delete all files?") is None
         assert policy.auto_response("Deploy to production?") is None
 
+    @pytest.mark.parametrize(
+        "question",
+        [
+            "Create the directory? (y/n)",
+            "Delete the directory?",
+            "What color should it be?",
+            "Run pytest now? Press enter",
+        ],
+    )
+    def test_auto_response_none_exactly_when_escalating(self, question: str) -> None:
+        policy = EscalationPolicy()
+        escalates = policy.should_escalate(question)
+        assert (policy.auto_response(question) is None) is escalates
+
     def test_assess_urgency_critical(self) -> None:
         """Critical urgency for production/billing/credentials."""
         policy = EscalationPolicy()
@@ -209,3 +227,89 @@ class TestEscalationPolicy:
 
         policy_no_timeout = EscalationPolicy(default_timeout_s=None)
         assert policy_no_timeout.default_timeout_s is None
+
+
+class TestPatternFusion:
+    """Tests for the single-scan pattern matcher."""
+
+    def test_defaults_are_shared_but_lists_are_independent(self) -> None:
+        first = EscalationPolicy()
+        second = EscalationPolicy()
+        assert first.always_escalate_patterns[0] is second.always_escalate_patterns[0]
+        assert first.always_escalate_patterns is not second.always_escalate_patterns
+
+        first.should_escalate("Delete it?")
+        second.should_escalate("Delete it?")
+        assert first._escalate_matcher.fused is second._escalate_matcher.fused
+
+    def test_equal_custom_configs_share_fused_regex(self) -> None:
+        first = EscalationPolicy(always_escalate_patterns=[re.compile(r"(?i)wipe")])
+        second = EscalationPolicy(always_escalate_patterns=[re.compile(r"(?i)wipe")])
+        first.should_escalate("wipe it?")
+        second.should_escalate("wipe it?")
+        assert first._escalate_matcher.fused is not None
+        assert first._escalate_matcher.fused is second._escalate_matcher.fused
+
+    def test_default_patterns_fuse(self) -> None:
+        policy = EscalationPolicy()
+        assert _fuse_patterns(tuple(policy.always_escalate_patterns)) is not None
+        assert _fuse_patterns(tuple(policy.auto_approve_patterns)) is not None
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            [re.compile(r"Deploy")],
+            [re.compile(r"(?i)[A-Z]+key")],
+            [re.compile(r"(?i)(\w)\1")],
+            [re.compile(r"(?im)^ok$")],
+        ],
+    )
+    def test_unfusable_patterns_fall_back(self, patterns: list) -> None:
+        assert _fuse_patterns(tuple(patterns)) is None
+
+    def test_fused_matches_case_insensitively(self) -> None:
+        policy = EscalationPolicy()
+        assert policy.should_escalate("DELETE everything?") is True
+        assert policy.should_escalate("Run PyTest?") is False
+        assert policy.should_escalate("cargo test --release?") is False
+
+    def test_mixed_case_sensitivity_preserved(self) -> None:
+        policy = EscalationPolicy(
+            always_escalate_patterns=[re.compile(r"(?i)danger"), re.compile("PROD")],
+            auto_approve_patterns=[re.compile(r"(?i)safe")],
+        )
+        assert policy.should_escalate("deploy to PROD, safe?") is True
+        assert policy.should_escalate("deploy to prod, safe?") is False
+
+    def test_pattern_list_mutation_is_seen(self) -> None:
+        policy = EscalationPolicy(
+            always_escalate_patterns=[re.compile(r"(?i)danger")],
+            auto_approve_patterns=[re.compile(r"(?i)safe")],
+        )
+        assert policy.should_escalate("a safe rollout?") is False
+        policy.always_escalate_patterns.append(re.compile(r"(?i)rollout"))
+        assert policy.should_escalate("a safe rollout?") is True
+
+
+class TestDecisionCache:
+    """Tests for memoized pattern decisions."""
+
+    def test_repeated_questions_hit_cache(self) -> None:
+        policy = EscalationPolicy()
+        assert policy.should_escalate("Run pytest?") is False
+        assert policy.should_escalate("Run pytest?") is False
+        assert policy._decisions == {("Run pytest?", None): False}
+
+    def test_cache_evicts_oldest(self) -> None:
+        policy = EscalationPolicy()
+        for i in range(_DECISION_CACHE_SIZE + 1):
+            policy.should_escalate(f"question {i}?")
+        assert len(policy._decisions) == _DECISION_CACHE_SIZE
+        assert ("question 0?", None) not in policy._decisions
+
+    def test_custom_decider_is_not_cached(self) -> None:
+        answers = iter(["auto", "escalate"])
+        policy = EscalationPolicy(custom_decider=lambda q, c: next(answers))
+        assert policy.should_escalate("Pick a color?") is False
+        assert policy.should_escalate("Pick a color?") is True
+        assert policy._decisions == {}
@@ -3,9 +3,15 @@ import uuid
 import anyio
 import pytest
 
-from takopi.runner_bridge import ExecBridgeConfig, IncomingMessage, handle_message
+from takopi.runner_bridge import (
+    ExecBridgeConfig,
+    IncomingMessage,
+    SessionCardEdits,
+    handle_message,
+)
 from takopi.markdown import MarkdownParts, MarkdownPresenter
 from takopi.model import ResumeToken, TakopiEvent
+from takopi.session_card import SessionCardBuilder
 from takopi.telegram.render import prepare_telegram
 from takopi.runners.codex import CodexRunner
 from takopi.runners.mock import Advance, Emit, Raise, Return, ScriptRunner, Wait
@@ -439,3 +445,56 @@ async def test_handle_message_error_preserves_resume_token() -> None:
     assert "error" in last_edit.lower()
     assert session_id in last_edit
     assert "codex resume" in last_edit.lower()
+
+
+class _CountingCardPresenter:
+    def __init__(self) -> None:
+        self.renders = 0
+
+    def render_session_card(
+        self, state, *, elapsed_s: float, expanded: bool = False
+    ) -> RenderedMessage:
+        self.renders += 1
+        return RenderedMessage(text=f"{len(state.activity_items)} @ {int(elapsed_s)}")
+
+
+@pytest.mark.anyio
+async def test_session_card_edits_skip_unchanged_builder() -> None:
+    transport = FakeTransport()
+    presenter = _CountingCardPresenter()
+    clock = _FakeClock()
+    builder = SessionCardBuilder(
+        session_id="s1", started_at=0.0, primary_engine="codex"
+    )
+    edits = SessionCardEdits(
+        transport=transport,
+        presenter=presenter,
+        channel_id=123,
+        progress_ref=MessageRef(channel_id=123, message_id=1),
+        builder=builder,
+        started_at=0.0,
+        clock=clock,
+        last_rendered=None,
+    )
+
+    def poke() -> None:
+        edits.event_seq += 1
+        edits.signal_send.send_nowait(None)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(edits.run)
+        builder.add_activity("codex", "action", "reading")
+        poke()
+        await anyio.wait_all_tasks_blocked()
+        poke()
+        await anyio.wait_all_tasks_blocked()
+        clock.set(1.5)
+        poke()
+        await anyio.wait_all_tasks_blocked()
+        edits.signal_send.close()
+
+    assert presenter.renders == 2
+    assert [call["message"].text for call in transport.edit_calls] == [
+        "1 @ 0",
+        "1 @ 1",
+    ]
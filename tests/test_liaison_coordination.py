@@ -1,13 +1,20 @@
 """Tests for the liaison coordination module."""
 
+import fcntl
 import json
+import os
 import pytest
+import shutil
+import sys
+import threading
 import time
 from pathlib import Path
 
 from takopi.runners.liaison_coordination import (
     CoordinationMessage,
     LiaisonCoordinator,
+    _next_message_id,
+    _RecentIds,
 )
 
 
@@ -211,6 +218,25 @@ class TestLiaisonCoordinator:
         messages2 = receiver.receive_messages()
         assert len(messages2) == 0
 
+    def test_send_messages_same_millisecond(self, coord_folder: Path) -> None:
+        """Messages sharing a timestamp should not overwrite each other."""
+        sender = LiaisonCoordinator(folder=coord_folder, liaison_id="sender")
+        receiver = LiaisonCoordinator(folder=coord_folder, liaison_id="receiver")
+        now = time.time()
+        sender.send_messages(
+            CoordinationMessage(
+                message_id=f"batch_{i}",
+                from_liaison="sender",
+                to_liaison=to_liaison,
+                timestamp=now,
+                type="info_share",
+            )
+            for i, to_liaison in enumerate(["receiver", "receiver", None, None])
+        )
+
+        received = sorted(msg.message_id for msg in receiver.receive_messages())
+        assert received == ["batch_0", "batch_1", "batch_2", "batch_3"]
+
     def test_receive_broadcast_messages(self, coord_folder: Path) -> None:
         """All liaisons should receive broadcast messages."""
         sender = LiaisonCoordinator(folder=coord_folder, liaison_id="sender")
@@ -239,6 +265,26 @@ class TestLiaisonCoordinator:
         messages1_again = receiver1.receive_messages()
         assert len(messages1_again) == 0
 
+    def test_delivered_broadcast_files_not_reopened(
+        self, coord_folder: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Polling again should skip broadcast files already delivered."""
+        sender = LiaisonCoordinator(folder=coord_folder, liaison_id="sender")
+        receiver = LiaisonCoordinator(folder=coord_folder, liaison_id="receiver")
+        sender.broadcast_discovery("finding", {"k": "v"})
+        assert len(receiver.receive_messages()) == 1
+
+        reads: list[Path] = []
+        original = LiaisonCoordinator._read_message
+
+        def counting_read(self, filepath, now, **kwargs):
+            reads.append(filepath)
+            return original(self, filepath, now, **kwargs)
+
+        monkeypatch.setattr(LiaisonCoordinator, "_read_message", counting_read)
+        assert receiver.receive_messages() == []
+        assert reads == []
+
     def test_ignore_own_messages(self, coord_folder: Path) -> None:
         """Liaison should not receive own messages."""
         coordinator = LiaisonCoordinator(folder=coord_folder, liaison_id="self")
@@ -301,6 +347,22 @@ class TestLiaisonCoordinator:
         active = coordinator.get_active_liaisons()
         assert "test_liaison" not in active
 
+    def test_active_liaisons_reuses_unchanged_state(self, coord_folder: Path) -> None:
+        """Repeated reads reuse the decoded state until a peer writes it."""
+        coord = LiaisonCoordinator(folder=coord_folder, liaison_id="reader")
+        peer = LiaisonCoordinator(folder=coord_folder, liaison_id="peer")
+        peer.register_liaison(task="work")
+        active_file = coord_folder / "state" / "active_liaisons.json"
+
+        first = coord.get_active_liaisons()
+        snapshot = coord._state_cache[active_file]
+        first["peer"]["status"] = "mutated"
+        assert coord.get_active_liaisons()["peer"]["status"] == "running"
+        assert coord._state_cache[active_file] is snapshot
+
+        peer.heartbeat(status="busy")
+        assert coord.get_active_liaisons()["peer"]["status"] == "busy"
+
     def test_stale_liaisons_filtered(self, coord_folder: Path) -> None:
         """Stale liaisons should be filtered from active list."""
         coordinator = LiaisonCoordinator(folder=coord_folder, liaison_id="stale")
@@ -362,6 +424,13 @@ class TestLiaisonCoordinator:
         assert context["api_endpoint"]["value"] == "https://example.com/api"
         assert context["api_endpoint"]["from_liaison"] == "liaison_1"
 
+    def test_corrupt_state_file_reads_as_default(
+        self, coordinator: LiaisonCoordinator, coord_folder: Path
+    ) -> None:
+        """A truncated state file should fall back to an empty state."""
+        (coord_folder / "state" / "shared_context.json").write_text('{"context": ')
+        assert coordinator.get_shared_context() == {}
+
     def test_broadcast_discovery(self, coord_folder: Path) -> None:
         """Discovery should be broadcast to all."""
         sender = LiaisonCoordinator(folder=coord_folder, liaison_id="discoverer")
@@ -411,3 +480,211 @@ class TestLiaisonCoordinator:
         for coord in coords:
             messages = coord.receive_messages()
             assert len(messages) == 4
+
+    def test_file_lock_times_out_when_held(
+        self, coordinator: LiaisonCoordinator
+    ) -> None:
+        """Lock acquisition should give up instead of blocking forever."""
+        target = coordinator.folder / "state" / "held.json"
+        lock_path = coordinator.folder / "locks" / "held.lock"
+
+        with open(lock_path, "w") as holder:
+            fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+            with (
+                pytest.raises(TimeoutError),
+                coordinator._file_lock(target, timeout=0.01),
+            ):
+                pass
+
+        with coordinator._file_lock(target, timeout=0.01):
+            pass
+
+    def test_batch_defers_state_writes(self, coord_folder: Path) -> None:
+        """Writes inside batch() land together when the block exits."""
+        coord = LiaisonCoordinator(folder=coord_folder, liaison_id="batcher")
+        peer = LiaisonCoordinator(folder=coord_folder, liaison_id="peer")
+        coord.register_liaison(task="batched")
+
+        with coord.batch():
+            coord.heartbeat(status="busy")
+            coord.share_context("phase", "build")
+            # Reads within the batch see the pending state
+            pending = coord._load_json(coord_folder / "state" / "active_liaisons.json")
+            assert pending["liaisons"]["batcher"]["status"] == "busy"
+            assert not (coord_folder / "state" / "shared_context.json").exists()
+
+        assert peer.get_active_liaisons()["batcher"]["status"] == "busy"
+        assert peer.get_shared_context()["phase"]["value"] == "build"
+        assert not list((coord_folder / "state").glob("*.tmp"))
+
+    def test_batch_discards_writes_on_error(self, coord_folder: Path) -> None:
+        """A failing batch should not persist partial state."""
+        coord = LiaisonCoordinator(folder=coord_folder, liaison_id="batcher")
+
+        with pytest.raises(RuntimeError), coord.batch():
+            coord.share_context("phase", "build")
+            raise RuntimeError("boom")
+
+        assert coord.get_shared_context() == {}
+        # Locks were released, so a new mutation goes through
+        coord.share_context("phase", "test")
+        assert coord.get_shared_context()["phase"]["value"] == "test"
+
+    def test_batches_with_opposite_orders_do_not_deadlock(
+        self, coord_folder: Path
+    ) -> None:
+        """Batches touching state files in different orders both complete."""
+        first = LiaisonCoordinator(folder=coord_folder, liaison_id="first")
+        second = LiaisonCoordinator(folder=coord_folder, liaison_id="second")
+        first.register_liaison(task="a")
+        second.register_liaison(task="b")
+        first_started = threading.Event()
+        errors: list[BaseException] = []
+
+        def run_first() -> None:
+            try:
+                with first.batch():
+                    first.heartbeat(status="busy")
+                    first_started.set()
+                    time.sleep(0.05)
+                    first.claim_task("t1", "first task")
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+            finally:
+                first_started.set()
+
+        def run_second() -> None:
+            first_started.wait()
+            try:
+                with second.batch():
+                    second.claim_task("t2", "second task")
+                    second.heartbeat(status="busy")
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=run_first),
+            threading.Thread(target=run_second),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert errors == []
+        active = first.get_active_liaisons()
+        assert active["first"]["status"] == "busy"
+        assert active["second"]["status"] == "busy"
+        tasks = first._load_json(coord_folder / "state" / "task_registry.json")
+        assert set(tasks["tasks"]) == {"t1", "t2"}
+
+    def test_send_recreates_removed_inbox(self, coord_folder: Path) -> None:
+        """Sending should survive an inbox deleted after it was created."""
+        sender = LiaisonCoordinator(folder=coord_folder, liaison_id="sender")
+        receiver = LiaisonCoordinator(folder=coord_folder, liaison_id="receiver")
+        sender.ask_liaison("receiver", "first?")
+        assert len(receiver.receive_messages()) == 1
+
+        inbox = coord_folder / "coordination" / "inbox" / "receiver"
+        inbox.rmdir()
+        sender.ask_liaison("receiver", "second?")
+
+        messages = receiver.receive_messages()
+        assert [m.payload["question"] for m in messages] == ["second?"]
+
+    def test_lock_recreates_removed_locks_dir(self, coord_folder: Path) -> None:
+        """State changes should survive a locks dir deleted after first use."""
+        coord = LiaisonCoordinator(folder=coord_folder, liaison_id="sharer")
+        coord.share_context("phase", "build")
+
+        shutil.rmtree(coord_folder / "locks")
+        coord.share_context("phase", "test")
+
+        assert coord.get_shared_context()["phase"]["value"] == "test"
+
+    def test_unreadable_message_files_skipped(self, coord_folder: Path) -> None:
+        """Empty or malformed message files should be dropped quietly."""
+        sender = LiaisonCoordinator(folder=coord_folder, liaison_id="sender")
+        receiver = LiaisonCoordinator(folder=coord_folder, liaison_id="receiver")
+        sender.ask_liaison("receiver", "still there?")
+        inbox = coord_folder / "coordination" / "inbox" / "receiver"
+        (inbox / "0_empty.json").write_bytes(b"")
+        (inbox / "1_broken.json").write_bytes(b'{"message_id": ')
+
+        messages = receiver.receive_messages()
+        assert [m.payload["question"] for m in messages] == ["still there?"]
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+    def test_wait_for_messages_wakes_on_send(self, coord_folder: Path) -> None:
+        """An armed watch should report new files and skip idle scans."""
+        sender = LiaisonCoordinator(folder=coord_folder, liaison_id="sender")
+        receiver = LiaisonCoordinator(folder=coord_folder, liaison_id="receiver")
+        try:
+            assert receiver.wait_for_messages(0) is True
+            assert receiver.receive_messages() == []
+            assert receiver.wait_for_messages(0.01) is False
+
+            sender.ask_liaison("receiver", "awake?")
+            sender.broadcast_discovery("finding", {"k": "v"})
+            assert receiver.wait_for_messages(1.0) is True
+            assert len(receiver.receive_messages()) == 2
+            assert receiver.receive_messages() == []
+        finally:
+            receiver.close()
+
+    def test_receive_iter_stopped_early_keeps_rest(self, coord_folder: Path) -> None:
+        """Breaking out of the iterator leaves unread messages queued."""
+        sender = LiaisonCoordinator(folder=coord_folder, liaison_id="sender")
+        receiver = LiaisonCoordinator(folder=coord_folder, liaison_id="receiver")
+        try:
+            assert receiver.wait_for_messages(0) is True
+            assert receiver.receive_messages() == []
+            sender.ask_liaison("receiver", "first?")
+            sender.ask_liaison("receiver", "second?")
+            assert receiver.wait_for_messages(1.0) is True
+
+            it = receiver.receive_messages_iter()
+            first = next(it)
+            it.close()
+            rest = receiver.receive_messages()
+            assert len(rest) == 1
+            assert rest[0].message_id != first.message_id
+            assert receiver.receive_messages() == []
+        finally:
+            receiver.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+    def test_forked_child_mints_distinct_message_ids(self) -> None:
+        """A forked child must not replay the parent's message ids."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, _next_message_id("msg").encode())
+            os._exit(0)
+        os.close(write_fd)
+        try:
+            child_id = os.read(read_fd, 256).decode()
+        finally:
+            os.close(read_fd)
+            os.waitpid(pid, 0)
+
+        assert child_id
+        assert child_id != _next_message_id("msg")
+
+
+class TestRecentIds:
+    """Tests for the bounded broadcast id tracker."""
+
+    def test_evicts_least_recently_seen(self) -> None:
+        ids = _RecentIds(maxsize=2)
+        ids.add("a")
+        ids.add("b")
+        assert "a" in ids  # refreshes "a"
+        ids.add("c")
+
+        assert len(ids) == 2
+        assert "a" in ids
+        assert "b" not in ids
+        assert "c" in ids
@@ -14,8 +14,9 @@ from takopi.runners.liaison import (
     LiaisonRunner,
     LiaisonStreamState,
     TmuxPane,
-    _QUESTION_PATTERNS,
+    _QUESTION_RE,
     _RESUME_RE,
+    _is_question,
 )
 from takopi.runners.escalation import EscalationPolicy
 
@@ -81,48 +82,41 @@ class TestQuestionPatterns:
 
     def test_detect_do_you_want(self) -> None:
         """'Do you want' questions should be detected."""
-        for pattern in _QUESTION_PATTERNS:
-            match = pattern.search("Do you want to continue?")
-            if match:
-                break
-        else:
-            pytest.fail("No pattern matched 'Do you want to continue?'")
+        assert _QUESTION_RE.search("Do you want to continue?")
 
     def test_detect_should_i(self) -> None:
         """'Should I' questions should be detected."""
-        for pattern in _QUESTION_PATTERNS:
-            match = pattern.search("Should I delete this file?")
-            if match:
-                break
-        else:
-            pytest.fail("No pattern matched 'Should I delete this file?'")
+        assert _QUESTION_RE.search("Should I delete this file?")
 
     def test_detect_yes_no_prompt(self) -> None:
         """y/n prompts should be detected."""
-        for pattern in _QUESTION_PATTERNS:
-            match = pattern.search("Continue? (y/n)")
-            if match:
-                break
-        else:
-            pytest.fail("No pattern matched 'Continue? (y/n)'")
+        assert _QUESTION_RE.search("Continue? (y/n)")
 
     def test_detect_confirm(self) -> None:
         """Confirm prompts should be detected."""
-        for pattern in _QUESTION_PATTERNS:
-            match = pattern.search("Please confirm?")
-            if match:
-                break
-        else:
-            pytest.fail("No pattern matched 'Please confirm?'")
+        assert _QUESTION_RE.search("Please confirm?")
 
     def test_detect_press_enter(self) -> None:
         """Press Enter prompts should be detected."""
-        for pattern in _QUESTION_PATTERNS:
-            match = pattern.search("Press Enter to continue")
-            if match:
-                break
-        else:
-            pytest.fail("No pattern matched 'Press Enter to continue'")
+        assert _QUESTION_RE.search("Press Enter to continue")
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Do you want to continue?",
+            "Continue? (y/n)",
+            "Overwrite [Y/N]:",
+            "Proceed yes/no >",
+            "PRESS ENTER TO CONTINUE",
+            "see https://example.com/?q=1 for details",
+            "Compiling takopi v0.1.0",
+            "Yes/No",
+            "",
+        ],
+    )
+    def test_is_question_matches_regex(self, line: str) -> None:
+        """The fast path agrees with the full question regex."""
+        assert _is_question(line) is (_QUESTION_RE.search(line) is not None)
 
 
 class TestTmuxPane:
@@ -202,11 +196,28 @@ class TestLiaisonRunnerHelpers:
         assert runner._shell_escape("hello world") == "'hello world'"
         assert runner._shell_escape("test'file") == "'test'\"'\"'file'"
 
+    def test_shell_escape_trailing_newline(self) -> None:
+        """A trailing newline must not slip through unquoted."""
+        runner = LiaisonRunner()
+        assert runner._shell_escape("file.py\n") == "'file.py\n'"
+
     def test_shell_escape_empty(self) -> None:
         """Empty string should return empty quotes."""
         runner = LiaisonRunner()
         assert runner._shell_escape("") == "''"
 
+    @pytest.mark.anyio
+    async def test_save_session_recreates_removed_folder(self, tmp_path: Path) -> None:
+        """Saving should survive a sessions folder deleted after setup."""
+        runner = LiaisonRunner()
+        state = LiaisonStreamState(coordination_folder=tmp_path, session_id="s1")
+        runner._ensure_folders(state)
+        (tmp_path / "sessions").rmdir()
+
+        await runner._save_session(state)
+
+        assert (tmp_path / "sessions" / "s1.json").exists()
+
     def test_truncate_output_short(self) -> None:
         """Short output should not be truncated."""
         runner = LiaisonRunner()
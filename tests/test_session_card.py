@@ -71,6 +71,17 @@ class TestPendingInput:
         assert pending.source == "codex"
         assert pending.urgency == "normal"
         assert pending.options == ("1MB", "5MB", "10MB")
+        assert pending.short_question == pending.question
+
+    def test_pending_input_short_question_truncates(self) -> None:
+        pending = PendingInput(
+            request_id="req-123",
+            question="x" * 81,
+            source="codex",
+            urgency="normal",
+        )
+
+        assert pending.short_question == "x" * 80 + "..."
 
 
 class TestSessionCardState:
@@ -368,6 +379,65 @@ class TestSessionCardBuilder:
         # Primary engine should be first
         assert state.badges[0].engine == "codex"
 
+    def test_build_reuses_badges_until_mutated(self) -> None:
+        builder = SessionCardBuilder(
+            session_id="s1",
+            started_at=time.time(),
+            primary_engine="codex",
+        )
+        first = builder.build()
+
+        assert builder.build().badges is first.badges
+
+        builder.increment_step("codex")
+        rebuilt = builder.build()
+
+        assert rebuilt.badges is not first.badges
+        assert rebuilt.badges[0].step_count == 1
+
+    def test_revision_changes_on_every_mutation(self) -> None:
+        builder = SessionCardBuilder(
+            session_id="s1",
+            started_at=time.time(),
+            primary_engine="codex",
+        )
+        seen = [builder.revision]
+        builder.build()
+        assert builder.revision == seen[-1]
+
+        builder.add_activity("codex", "action", "reading")
+        seen.append(builder.revision)
+        builder.set_context("ctx")
+        seen.append(builder.revision)
+        builder.set_cancelled()
+        seen.append(builder.revision)
+
+        assert len(set(seen)) == len(seen)
+
+    def test_timestamps_come_from_injected_clock(self) -> None:
+        ticks = iter(range(1, 100))
+        builder = SessionCardBuilder(
+            session_id="s1",
+            started_at=0.0,
+            primary_engine="codex",
+            clock=lambda: float(next(ticks)),
+        )
+        builder.add_activity("codex", "action", "reading")
+        builder.add_pending_input(
+            InputRequestEvent(
+                engine="codex",
+                request_id="r1",
+                question="Q?",
+                source="codex",
+                urgency="normal",
+            )
+        )
+
+        state = builder.build()
+        assert state.badges[0].last_activity == 1.0
+        assert state.activity_items[0].timestamp == 2.0
+        assert state.pending_inputs[0].received_at == 3.0
+
 
 class TestFormatBadge:
     def test_format_known_engine(self) -> None:
@@ -410,3 +480,13 @@ class TestFormatActivityItem:
 
         assert "[codex]" not in formatted
         assert "reading file" in formatted
+
+    def test_format_unknown_kind_uses_bullet(self) -> None:
+        item = ActivityItem(
+            timestamp=time.time(),
+            engine="mystery",
+            kind="unheard_of",
+            summary="doing things",
+        )
+
+        assert format_activity_item(item) == "• [mystery] doing things"
@@ -1,6 +1,8 @@
 """Tests for smart_router.py - heuristic-based engine routing."""
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from takopi.router import AutoRouter, RunnerEntry
@@ -9,8 +11,13 @@ from takopi.smart_router import (
     RoutingDecision,
     SmartRouter,
     create_smart_router,
+    _ANCHOR_PREFIXES,
+    _ANCHORED_PATTERNS,
+    _KEYWORDS,
     _LIAISON_PATTERNS,
     _SIMPLE_PATTERNS,
+    _score_prompt,
+    _score_prompt_cached,
 )
 
 
@@ -24,10 +31,19 @@ def _make_router(*, has_liaison: bool = False) -> AutoRouter:
     return AutoRouter(entries=entries, default_engine=codex.engine)
 
 
+@pytest.fixture(scope="module")
+def liaison_router() -> AutoRouter:
+    return _make_router(has_liaison=True)
+
+
+@pytest.fixture(scope="module")
+def plain_router() -> AutoRouter:
+    return _make_router(has_liaison=False)
+
+
 class TestRoutingDecision:
-    def test_explicit_engine_takes_priority(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
+    def test_explicit_engine_takes_priority(self, liaison_router: AutoRouter) -> None:
+        smart = SmartRouter(router=liaison_router)
 
         decision = smart.analyze(
             "refactor all files across the codebase",
@@ -39,9 +55,8 @@ class TestRoutingDecision:
         assert decision.confidence == 1.0
         assert not decision.suggested_multi_agent
 
-    def test_resume_engine_takes_priority(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
+    def test_resume_engine_takes_priority(self, liaison_router: AutoRouter) -> None:
+        smart = SmartRouter(router=liaison_router)
 
         decision = smart.analyze(
             "refactor all files across the codebase",
@@ -53,36 +68,42 @@ class TestRoutingDecision:
         assert decision.confidence == 1.0
         assert not decision.suggested_multi_agent
 
+    def test_constant_decisions_are_shared(self, liaison_router: AutoRouter) -> None:
+        smart = SmartRouter(router=liaison_router)
 
-class TestLiaisonPatterns:
-    def test_refactor_across_suggests_liaison(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("refactor all the files across the codebase")
-
-        assert decision.suggested_multi_agent
-
-    def test_update_all_files_suggests_liaison(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("update all config files to use the new format")
-
-        assert decision.suggested_multi_agent
-
-    def test_migrate_suggests_liaison(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("migrate from REST to GraphQL")
+        assert smart.analyze("a", explicit_engine="codex") is smart.analyze(
+            "b", explicit_engine="codex"
+        )
+        plain = smart.analyze("hello there")
+        assert plain == RoutingDecision(
+            engine="codex",
+            reason="default",
+            confidence=0.5,
+            suggested_multi_agent=False,
+        )
+        assert smart.analyze("general kenobi") is plain
 
-        assert decision.suggested_multi_agent
 
-    def test_coordinate_suggests_liaison(self) -> None:
-        router = _make_router(has_liaison=True)
+class TestLiaisonPatterns:
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "refactor all the files across the codebase",
+            "update all config files to use the new format",
+            "migrate from REST to GraphQL",
+            "update the tests in parallel",
+            "search the entire codebase for deprecated functions",
+            "Orchestrate The Rollout ACROSS THE CODEBASE",
+        ],
+    )
+    def test_suggests_liaison(self, liaison_router: AutoRouter, prompt: str) -> None:
+        smart = SmartRouter(router=liaison_router)
+
+        assert smart.analyze(prompt).suggested_multi_agent
+
+    def test_coordinate_suggests_liaison(self, liaison_router: AutoRouter) -> None:
         # Use suggest_only=False to get the actual liaison score in confidence
-        smart = SmartRouter(router=router, suggest_only=False)
+        smart = SmartRouter(router=liaison_router, suggest_only=False)
 
         decision = smart.analyze("coordinate the changes between frontend and backend")
 
@@ -90,62 +111,31 @@ class TestLiaisonPatterns:
         assert decision.reason == "heuristic"
         assert decision.confidence >= 0.9
 
-    def test_in_parallel_suggests_liaison(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("update the tests in parallel")
-
-        assert decision.suggested_multi_agent
-
-    def test_entire_codebase_suggests_liaison(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("search the entire codebase for deprecated functions")
-
-        assert decision.suggested_multi_agent
-
 
 class TestSimplePatterns:
-    def test_fix_typo_is_simple(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("fix the typo in README")
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "fix the typo in README",
+            "what is the purpose of this function?",
+            "explain how the auth flow works",
+            "how do I run the tests?",
+        ],
+    )
+    def test_is_simple(self, liaison_router: AutoRouter, prompt: str) -> None:
+        smart = SmartRouter(router=liaison_router)
+
+        decision = smart.analyze(prompt)
 
         assert not decision.suggested_multi_agent
         assert decision.reason == "default"
 
-    def test_what_is_question_is_simple(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("what is the purpose of this function?")
-
-        assert not decision.suggested_multi_agent
-
-    def test_explain_is_simple(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("explain how the auth flow works")
-
-        assert not decision.suggested_multi_agent
-
-    def test_how_to_question_is_simple(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router)
-
-        decision = smart.analyze("how do I run the tests?")
-
-        assert not decision.suggested_multi_agent
-
 
 class TestSuggestOnlyMode:
-    def test_suggest_only_does_not_switch_engine(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router, suggest_only=True)
+    def test_suggest_only_does_not_switch_engine(
+        self, liaison_router: AutoRouter
+    ) -> None:
+        smart = SmartRouter(router=liaison_router, suggest_only=True)
 
         decision = smart.analyze("refactor all modules across the codebase")
 
@@ -153,9 +143,10 @@ class TestSuggestOnlyMode:
         assert decision.suggested_multi_agent
         assert decision.reason == "default"
 
-    def test_auto_switch_when_not_suggest_only(self) -> None:
-        router = _make_router(has_liaison=True)
-        smart = SmartRouter(router=router, suggest_only=False)
+    def test_auto_switch_when_not_suggest_only(
+        self, liaison_router: AutoRouter
+    ) -> None:
+        smart = SmartRouter(router=liaison_router, suggest_only=False)
 
         decision = smart.analyze("orchestrate the deployment")
 
@@ -165,37 +156,73 @@ class TestSuggestOnlyMode:
 
 
 class TestLiaisonAvailability:
-    def test_no_suggestion_without_liaison_engine(self) -> None:
-        router = _make_router(has_liaison=False)
-        smart = SmartRouter(router=router)
+    def test_no_suggestion_without_liaison_engine(
+        self, plain_router: AutoRouter
+    ) -> None:
+        smart = SmartRouter(router=plain_router)
 
         decision = smart.analyze("refactor all modules across the codebase")
 
         assert not decision.suggested_multi_agent
         assert decision.engine == "codex"
 
+    def test_liaison_check_follows_router_swap(
+        self, liaison_router: AutoRouter, plain_router: AutoRouter
+    ) -> None:
+        smart = SmartRouter(router=plain_router)
+        assert not smart._has_liaison_engine()
+
+        smart.router = liaison_router
+
+        assert smart._has_liaison_engine()
+        assert smart.analyze("orchestrate the deployment").suggested_multi_agent
+
+
+class TestAnalyzeAsync:
+    @pytest.mark.anyio
+    async def test_matches_sync_analysis(self, liaison_router: AutoRouter) -> None:
+        smart = SmartRouter(router=liaison_router)
+        short = "refactor all modules across the codebase"
+        long = short + " and keep going" * 100
+
+        assert await smart.analyze_async(short) == smart.analyze(short)
+        assert await smart.analyze_async(long) == smart.analyze(long)
+        assert (
+            await smart.analyze_async(long, resume_engine="claude")
+        ).reason == "resume"
+
+
+class TestAnalyzeMany:
+    def test_matches_per_prompt_analysis(self, liaison_router: AutoRouter) -> None:
+        smart = SmartRouter(router=liaison_router)
+        prompts = [
+            "refactor all modules across the codebase",
+            "fix the typo in README",
+            "x" * 2000,
+            "refactor all modules across the codebase",
+        ]
+
+        assert smart.analyze_many(prompts) == [smart.analyze(p) for p in prompts]
+        assert smart.analyze_many([]) == []
+
 
 class TestCreateSmartRouter:
-    def test_returns_none_when_disabled(self) -> None:
-        router = _make_router()
-        result = create_smart_router(router, enabled=False)
+    def test_returns_none_when_disabled(self, plain_router: AutoRouter) -> None:
+        result = create_smart_router(plain_router, enabled=False)
         assert result is None
 
-    def test_returns_router_when_enabled(self) -> None:
-        router = _make_router()
-        result = create_smart_router(router, enabled=True)
+    def test_returns_router_when_enabled(self, plain_router: AutoRouter) -> None:
+        result = create_smart_router(plain_router, enabled=True)
         assert result is not None
         assert isinstance(result, SmartRouter)
 
-    def test_respects_suggest_only_setting(self) -> None:
-        router = _make_router()
-        result = create_smart_router(router, enabled=True, suggest_only=False)
+    def test_respects_suggest_only_setting(self, plain_router: AutoRouter) -> None:
+        result = create_smart_router(plain_router, enabled=True, suggest_only=False)
         assert result is not None
         assert not result.suggest_only
 
-    def test_respects_threshold_setting(self) -> None:
-        router = _make_router()
-        result = create_smart_router(router, enabled=True, liaison_threshold=0.5)
+    def test_respects_threshold_setting(self, plain_router: AutoRouter) -> None:
+        result = create_smart_router(plain_router, enabled=True, liaison_threshold=0.5)
         assert result is not None
         assert result.liaison_threshold == 0.5
 
@@ -203,12 +230,77 @@ class TestCreateSmartRouter:
 class TestPatternCompilation:
     def test_liaison_patterns_are_compiled(self) -> None:
         """Verify all liaison patterns compile without error."""
-        for pattern, weight in _LIAISON_PATTERNS:
-            assert pattern.pattern  # Access compiled pattern
+        for source, weight in _LIAISON_PATTERNS:
+            assert re.compile(source).pattern
             assert 0.0 <= weight <= 1.0
 
     def test_simple_patterns_are_compiled(self) -> None:
         """Verify all simple patterns compile without error."""
-        for pattern, weight in _SIMPLE_PATTERNS:
-            assert pattern.pattern
+        for source, weight in _SIMPLE_PATTERNS:
+            assert re.compile(source).pattern
             assert 0.0 <= weight <= 1.0
+
+    def test_every_pattern_has_a_prefilter_keyword(self) -> None:
+        """The keyword prefilter must not hide any pattern."""
+        for source, _ in [*_LIAISON_PATTERNS, *_SIMPLE_PATTERNS]:
+            assert re.search(_KEYWORDS, source), source
+
+    def test_anchored_patterns_start_with_a_prefix(self) -> None:
+        """The startswith gate must admit every anchored pattern."""
+        for source, _ in _ANCHORED_PATTERNS:
+            head = re.match(r"\^(?:\(\?:([\w|]+)\)|(\w+))", source)
+            assert head is not None, source
+            words = (head.group(1) or head.group(2)).split("|")
+            assert set(words) <= set(_ANCHOR_PREFIXES), source
+
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "refactor all modules across the codebase",
+            "what is the typo in the file",
+            "why does update the readme fail",
+            "read the code in parallel",
+            " fix the bug",
+            "fix the typo in this file",
+            "Update every config files and then run tests",
+            "update the readme in parallel",
+            "build the parser with tests for multiple modules",
+            "explain how to coordinate in parallel",
+            "nothing interesting here",
+            "",
+        ],
+    )
+    def test_combined_scan_matches_per_pattern_max(self, prompt: str) -> None:
+        """The single-scan scorer agrees with searching each pattern."""
+        _score_prompt_cached.cache_clear()
+        prompt = prompt.strip().lower()
+
+        def expected(patterns: list[tuple[str, float]]) -> float:
+            return max((w for p, w in patterns if re.search(p, prompt)), default=0.0)
+
+        assert _score_prompt(prompt) == (
+            expected(_LIAISON_PATTERNS),
+            expected(_SIMPLE_PATTERNS),
+        )
+
+    def test_score_prompt_caches_short_prompts(self) -> None:
+        _score_prompt_cached.cache_clear()
+
+        assert _score_prompt("Fix the typo across the codebase") == (0.8, 0.9)
+        assert _score_prompt("fix the TYPO across the codebase") == (0.8, 0.9)
+        assert _score_prompt_cached.cache_info().hits == 1
+
+        long_prompt = "typo " * 1000
+        assert _score_prompt(long_prompt) == (0.0, 0.9)
+        assert _score_prompt_cached.cache_info().currsize == 1
+
+    def test_prompts_shorter_than_any_match_score_zero(self) -> None:
+        _score_prompt_cached.cache_clear()
+
+        assert _score_prompt("ok") == (0.0, 0.0)
+        assert _score_prompt_cached.cache_info().misses == 0
+        assert _score_prompt("TYPO") == (0.0, 0.9)
+
+    def test_leading_whitespace_does_not_hide_anchored_patterns(self) -> None:
+        assert _score_prompt("\n  What is this?  ") == _score_prompt("what is this?")
+        assert _score_prompt("  explain the flow")[1] == 0.9
@@ -20,10 +20,14 @@ from takopi.telegram.bridge import (
     TelegramBridgeConfig,
     TelegramPresenter,
     TelegramTransport,
+    _format_elapsed,
     build_bot_commands,
     handle_callback_cancel,
+    handle_callback_input_response,
     handle_cancel,
     is_cancel_command,
+    is_input_callback,
+    parse_input_callback,
     run_main_loop,
     send_with_resume,
 )
@@ -35,10 +39,11 @@ from takopi.telegram.chat_prefs import ChatPrefsStore, resolve_prefs_path
 from takopi.telegram.engine_overrides import EngineOverrides
 from takopi.context import RunContext
 from takopi.config import ProjectConfig, ProjectsConfig
-from takopi.runner_bridge import ExecBridgeConfig, RunningTask
+from takopi.runner_bridge import ExecBridgeConfig, PendingInputRequest, RunningTask
 from takopi.markdown import MarkdownPresenter
-from takopi.model import ResumeToken
+from takopi.model import InputRequestEvent, ResumeToken
 from takopi.progress import ProgressTracker
+from takopi.session_card import SessionCardBuilder
 from takopi.router import AutoRouter, RunnerEntry
 from takopi.scheduler import ThreadScheduler
 from takopi.transport_runtime import TransportRuntime
@@ -286,6 +291,120 @@ def test_telegram_presenter_split_overflow_adds_followups() -> None:
     )
 
 
+def test_telegram_presenter_input_request_layout() -> None:
+    presenter = TelegramPresenter()
+    event = InputRequestEvent(
+        engine="liaison",
+        request_id="req1",
+        question="Which database?",
+        source="subagent",
+        context="migrating users",
+        options=["postgres", "sqlite"],
+        urgency="high",
+    )
+
+    rendered = presenter.render_input_request(event)
+
+    assert rendered.text.startswith("[!] Question from subagent")
+    assert (
+        "Which database?\n\nOptions:\n\n1. postgres\n2. sqlite"
+        "\n\n(Context: migrating users)"
+    ) in rendered.text
+    keyboard = rendered.extra["reply_markup"]["inline_keyboard"]
+    assert keyboard[0][0]["callback_data"] == "takopi:answer:req1"
+    assert keyboard[1][0]["callback_data"] == "takopi:auto:req1"
+    again = presenter.render_input_request(event)
+    assert again.extra["reply_markup"] is rendered.extra["reply_markup"]
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ("takopi:answer:req1", ("answer", "req1")),
+        ("takopi:auto:req:2", ("auto", "req:2")),
+        ("takopi:answer:", ("answer", "")),
+        ("takopi:cancel", None),
+        ("takopi:expand", None),
+        ("takopi:answers:req1", None),
+        ("other:answer:req1", None),
+    ],
+)
+def test_parse_input_callback(data: str, expected: tuple[str, str] | None) -> None:
+    assert parse_input_callback(data) == expected
+    assert is_input_callback(data) is (expected is not None)
+
+
+def test_format_elapsed_truncates_to_whole_seconds() -> None:
+    assert _format_elapsed(0.4) == "0s"
+    assert _format_elapsed(59.9) == "59s"
+    assert _format_elapsed(61.7) == "1m 1s"
+    assert _format_elapsed(3600) == "1h 0m"
+    assert _format_elapsed(7322.5) == "2h 2m"
+
+
+def _session_card_builder() -> SessionCardBuilder:
+    builder = SessionCardBuilder(
+        session_id="s1", started_at=0.0, primary_engine="liaison"
+    )
+    builder.add_agent("liaison")
+    builder.add_activity("liaison", "action", "reading files")
+    return builder
+
+
+def test_telegram_presenter_session_card_reuses_unchanged_render() -> None:
+    presenter = TelegramPresenter()
+    builder = _session_card_builder()
+
+    first = presenter.render_session_card(builder.build(), elapsed_s=5.2)
+    again = presenter.render_session_card(builder.build(), elapsed_s=5.9)
+
+    assert again is first
+    assert "reading files" in first.text
+
+
+def test_telegram_presenter_session_card_rerenders_on_change() -> None:
+    presenter = TelegramPresenter()
+    builder = _session_card_builder()
+    first = presenter.render_session_card(builder.build(), elapsed_s=5.0)
+
+    later = presenter.render_session_card(builder.build(), elapsed_s=6.0)
+    builder.add_activity("liaison", "action", "running tests")
+    changed = presenter.render_session_card(builder.build(), elapsed_s=6.0)
+    expanded = presenter.render_session_card(
+        builder.build(), elapsed_s=6.0, expanded=True
+    )
+
+    assert later is not first
+    assert "6s" in later.text
+    assert "running tests" in changed.text
+    assert expanded is not changed
+
+
+def test_telegram_presenter_session_card_lists_pending_inputs() -> None:
+    presenter = TelegramPresenter()
+    builder = _session_card_builder()
+    builder.add_agent("claude")
+    builder.add_pending_input(
+        InputRequestEvent(
+            engine="liaison",
+            request_id="req1",
+            question="q" * 100,
+            source="subagent",
+            urgency="critical",
+        )
+    )
+
+    rendered = presenter.render_session_card(builder.build(), elapsed_s=1.0)
+
+    assert "1. [!!] [subagent] " + "q" * 80 + "...\n" in rendered.text
+    keyboard = rendered.extra["reply_markup"]["inline_keyboard"]
+    assert [button["callback_data"] for button in keyboard[0]] == [
+        "takopi:answer:req1",
+        "takopi:auto:req1",
+    ]
+    assert keyboard[0][0]["text"] == "\u270f Answer [subagent]"
+
+
 @pytest.mark.anyio
 async def test_telegram_transport_passes_replace_and_wait() -> None:
     bot = FakeBot()
@@ -814,6 +933,41 @@ async def test_handle_callback_cancel_cancels_running_task() -> None:
     assert bot.callback_calls[-1]["text"] == "cancelling..."
 
 
+@pytest.mark.anyio
+async def test_handle_callback_input_response_finds_owning_task() -> None:
+    transport = FakeTransport()
+    cfg = make_cfg(transport)
+    idle = RunningTask()
+    owner = RunningTask()
+    owner.pending_inputs["req1"] = PendingInputRequest(
+        request_id="req1", question="Which db?", source="liaison", urgency="normal"
+    )
+    running_tasks = {
+        MessageRef(channel_id=123, message_id=1): idle,
+        MessageRef(channel_id=123, message_id=2): owner,
+    }
+
+    def query(data: str) -> TelegramCallbackQuery:
+        return TelegramCallbackQuery(
+            transport="telegram",
+            chat_id=123,
+            message_id=2,
+            callback_query_id="cbq-1",
+            data=data,
+            sender_id=123,
+        )
+
+    await handle_callback_input_response(cfg, query("takopi:auto:req1"), running_tasks)
+    await handle_callback_input_response(cfg, query("takopi:auto:req1"), running_tasks)
+
+    bot = cast(FakeBot, cfg.bot)
+    assert [call["text"] for call in bot.callback_calls] == [
+        "Letting liaison decide...",
+        "Request no longer active",
+    ]
+    assert owner.pending_inputs == {}
+
+
 @pytest.mark.anyio
 async def test_handle_callback_cancel_cancels_queued_job() -> None:
     transport = FakeTransport()
@@ -3,11 +3,12 @@ from pathlib import Path
 
 import pytest
 
-from takopi.settings import TelegramTopicsSettings
 from takopi.config import ProjectConfig, ProjectsConfig
 from takopi.runners.mock import Return, ScriptRunner
-from takopi.telegram.chat_sessions import ChatSessionStore
+from takopi.settings import TelegramTopicsSettings
+from takopi.telegram.bridge import TelegramBridgeConfig
 from takopi.telegram.chat_prefs import ChatPrefsStore, resolve_prefs_path
+from takopi.telegram.chat_sessions import ChatSessionStore
 from takopi.telegram.commands.topics import (
     _handle_chat_ctx_command,
     _handle_chat_new_command,
@@ -17,19 +18,22 @@ from takopi.telegram.commands.topics import (
 )
 from takopi.telegram.topic_state import TopicStateStore
 from takopi.telegram.types import TelegramIncomingMessage
+from takopi.transport_runtime import TransportRuntime
 from tests.telegram_fakes import (
     DEFAULT_ENGINE_ID,
     FakeTransport,
     _make_router,
     make_cfg,
 )
-from takopi.transport_runtime import TransportRuntime
+
+_DEFAULT_CHAT_ID = 123
+_SCOPE_CHAT_IDS = frozenset({_DEFAULT_CHAT_ID})
 
 
 def _msg(
     text: str,
     *,
-    chat_id: int = 123,
+    chat_id: int = _DEFAULT_CHAT_ID,
     message_id: int = 1,
     thread_id: int | None = None,
     chat_type: str | None = "private",
@@ -68,26 +72,42 @@ def _runtime(tmp_path: Path) -> tuple[TransportRuntime, Path]:
     return runtime, state_path
 
 
-@pytest.mark.anyio
-async def test_ctx_command_requires_topic(tmp_path: Path) -> None:
-    transport = FakeTransport()
-    cfg = replace(
-        make_cfg(transport),
+@pytest.fixture
+def topics_cfg(fake_transport: FakeTransport) -> TelegramBridgeConfig:
+    return replace(
+        make_cfg(fake_transport),
         topics=TelegramTopicsSettings(enabled=True, scope="all"),
     )
-    store = TopicStateStore(tmp_path / "topics.json")
+
+
+@pytest.fixture
+def topic_store(tmp_path: Path) -> TopicStateStore:
+    return TopicStateStore(tmp_path / "topics.json")
+
+
+@pytest.fixture
+def session_store(tmp_path: Path) -> ChatSessionStore:
+    return ChatSessionStore(tmp_path / "sessions.json")
+
+
+@pytest.mark.anyio
+async def test_ctx_command_requires_topic(
+    fake_transport: FakeTransport,
+    topics_cfg: TelegramBridgeConfig,
+    topic_store: TopicStateStore,
+) -> None:
     msg = _msg("/ctx")
 
     await _handle_ctx_command(
-        cfg,
+        topics_cfg,
         msg,
         args_text="",
-        store=store,
+        store=topic_store,
         resolved_scope="all",
-        scope_chat_ids=frozenset({msg.chat_id}),
+        scope_chat_ids=_SCOPE_CHAT_IDS,
     )
 
-    text = transport.send_calls[-1]["message"].text
+    text = fake_transport.send_calls[-1]["message"].text
     assert "only works inside a topic" in text
 
 
@@ -119,71 +139,69 @@ async def test_chat_ctx_command_sets_binding(tmp_path: Path) -> None:
 
 
 @pytest.mark.anyio
-async def test_new_command_requires_topic(tmp_path: Path) -> None:
-    transport = FakeTransport()
-    cfg = replace(
-        make_cfg(transport),
-        topics=TelegramTopicsSettings(enabled=True, scope="all"),
-    )
-    store = TopicStateStore(tmp_path / "topics.json")
+async def test_new_command_requires_topic(
+    fake_transport: FakeTransport,
+    topics_cfg: TelegramBridgeConfig,
+    topic_store: TopicStateStore,
+) -> None:
     msg = _msg("/new")
 
     await _handle_new_command(
-        cfg,
+        topics_cfg,
         msg,
-        store=store,
+        store=topic_store,
         resolved_scope="all",
-        scope_chat_ids=frozenset({msg.chat_id}),
+        scope_chat_ids=_SCOPE_CHAT_IDS,
     )
 
-    text = transport.send_calls[-1]["message"].text
+    text = fake_transport.send_calls[-1]["message"].text
     assert "only works inside a topic" in text
 
 
 @pytest.mark.anyio
-async def test_chat_new_command_no_sessions(tmp_path: Path) -> None:
-    transport = FakeTransport()
-    cfg = make_cfg(transport)
-    store = ChatSessionStore(tmp_path / "sessions.json")
+async def test_chat_new_command_no_sessions(
+    fake_transport: FakeTransport, session_store: ChatSessionStore
+) -> None:
+    cfg = make_cfg(fake_transport)
     msg = _msg("/new", chat_type="private")
 
-    await _handle_chat_new_command(cfg, msg, store, session_key=None)
+    await _handle_chat_new_command(cfg, msg, session_store, session_key=None)
 
-    text = transport.send_calls[-1]["message"].text
+    text = fake_transport.send_calls[-1]["message"].text
     assert "no stored sessions" in text
 
 
 @pytest.mark.anyio
-async def test_chat_new_command_group_clears(tmp_path: Path) -> None:
-    transport = FakeTransport()
-    cfg = make_cfg(transport)
-    store = ChatSessionStore(tmp_path / "sessions.json")
+async def test_chat_new_command_group_clears(
+    fake_transport: FakeTransport, session_store: ChatSessionStore
+) -> None:
+    cfg = make_cfg(fake_transport)
     msg = _msg("/new", chat_type="supergroup")
 
-    await _handle_chat_new_command(cfg, msg, store, session_key=(msg.chat_id, 1))
+    await _handle_chat_new_command(
+        cfg, msg, session_store, session_key=(msg.chat_id, 1)
+    )
 
-    text = transport.send_calls[-1]["message"].text
+    text = fake_transport.send_calls[-1]["message"].text
     assert "cleared stored sessions for you in this chat" in text
 
 
 @pytest.mark.anyio
-async def test_topic_command_requires_args(tmp_path: Path) -> None:
-    transport = FakeTransport()
-    cfg = replace(
-        make_cfg(transport),
-        topics=TelegramTopicsSettings(enabled=True, scope="all"),
-    )
-    store = TopicStateStore(tmp_path / "topics.json")
+async def test_topic_command_requires_args(
+    fake_transport: FakeTransport,
+    topics_cfg: TelegramBridgeConfig,
+    topic_store: TopicStateStore,
+) -> None:
     msg = _msg("/topic")
 
     await _handle_topic_command(
-        cfg,
+        topics_cfg,
         msg,
         args_text="",
-        store=store,
+        store=topic_store,
         resolved_scope="all",
-        scope_chat_ids=frozenset({msg.chat_id}),
+        scope_chat_ids=_SCOPE_CHAT_IDS,
     )
 
-    text = transport.send_calls[-1]["message"].text
+    text = fake_transport.send_calls[-1]["message"].text
     assert "usage: /topic" in text